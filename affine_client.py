@@ -1,19 +1,44 @@
 import time
 import uuid
 import random
+import asyncio
 from rich.console import Console
+from rich.progress import Progress
+from config import flag, simulate, verbose
 
 console = Console()
 
+# (task_type, valid) -> feedback
+_FEEDBACK = {
+    ("DED", True): "Logical consistency confirmed. Deduction valid.",
+    ("DED", False): "Logical fallacy detected in premise 2. Deduction invalid.",
+    ("ABD", True): "Hypothesis explains all observed phenomena. High probability.",
+    ("ABD", False): "Hypothesis fails to account for edge case X.",
+    ("ARC", True): "Pattern recognition successful. Transformation rule verified.",
+    ("ARC", False): "Failed to generalize pattern to test set.",
+    ("CDE", True): "Code output matches expected result. O(n) complexity.",
+    ("CDE", False): "Runtime Error or outputs do not match.",
+}
+
 class AffineClient:
     """
     Adapter for Affine Cortex (SN??) - The Proving Ground.
     Uses Affine's incentivized RL environments to verify reasoning and logic.
     """
+    # Simulated latencies (seconds), only applied when simulate_latency is on
+    VERIFY_LATENCY = 1.5
+    COMPUTE_STEP_LATENCY = 0.8
+
     def __init__(self):
         self.environments = ["DED", "ABD", "ARC", "CDE"]
         # In a real scenario, this would initialize the Affine SDK
         # from affine import DED, ABD, ARC
+        # Demo pacing is opt-in: OPENCLAW_SIMULATE=1 restores the artificial delays
+        # (the same switch as the SN13/SN74 adapters). AFFINE_SIMULATE is the older
+        # Affine-only name, still honoured so existing .env files keep working.
+        self.simulate_latency = simulate() or flag("AFFINE_SIMULATE")
+        # OPENCLAW_VERBOSE=0 silences informational output
+        self.verbose = verbose()
 
     def verify_thought(self, though_process: str, task_type: str = "DED") -> dict:
         """
@@ -29,22 +54,48 @@ class AffineClient:
         if task_type not in self.environments:
             return {"error": f"Unknown environment: {task_type}. Available: {self.environments}"}
 
-        task_id = str(uuid.uuid4())[:8]
-        console.print(f"[bold magenta]🧠 Affine Cortex: Verifying logic in {task_type} environment (Task {task_id})...[/bold magenta]")
+        task_id = self._start_task(task_type)
         
         # Simulate evaluation time
-        time.sleep(1.5)
+        if self.simulate_latency:
+            time.sleep(self.VERIFY_LATENCY)
+        
+        return self._evaluate(task_id, though_process, task_type)
+
+    async def verify_thought_async(self, though_process: str, task_type: str = "DED") -> dict:
+        """
+        Async variant of verify_thought; simulated latency uses asyncio.sleep,
+        so N verifications gathered together take max(t) instead of sum(t).
+        """
+        if task_type not in self.environments:
+            return {"error": f"Unknown environment: {task_type}. Available: {self.environments}"}
+
+        task_id = self._start_task(task_type)
+        
+        if self.simulate_latency:
+            await asyncio.sleep(self.VERIFY_LATENCY)
         
+        return self._evaluate(task_id, though_process, task_type)
+
+    def _start_task(self, task_type: str) -> str:
+        task_id = str(uuid.uuid4())[:8]
+        if self.verbose:
+            console.print(f"[bold magenta]🧠 Affine Cortex: Verifying logic in {task_type} environment (Task {task_id})...[/bold magenta]")
+        return task_id
+
+    def _evaluate(self, task_id: str, though_process: str, task_type: str) -> dict:
         # Mock logic to determine score based on length/keywords (for demo purposes)
         score = min(0.99, 0.5 + (len(though_process) / 1000.0))
-        if "error" in though_process.lower() or "false" in though_process.lower():
+        lowered = though_process.lower()
+        if "error" in lowered or "false" in lowered:
             score = 0.2
             
         valid = score > 0.7
         
         feedback = self._generate_feedback(task_type, valid, score)
         
-        console.print(f"[dim]Evaluated against 12 validators. Consensus Score: {score:.2f}[/dim]")
+        if self.verbose:
+            console.print(f"[dim]Evaluated against 12 validators. Consensus Score: {score:.2f}[/dim]")
         
         return {
             "task_id": task_id,
@@ -59,36 +110,24 @@ class AffineClient:
         Generates a Hyper-Logic response using Affine Cortex (SN120).
         This is Level 3 thinking: The 'Supreme Judge'.
         """
-        console.print(f"[bold red]🧠 NEXUS SIGNAL: Activating Affine Cortex (SN120) for Critical Task...[/bold red]")
-        console.print(f"[dim]Prompt: {prompt[:50]}...[/dim]")
+        if self.verbose:
+            console.print(f"[bold red]🧠 NEXUS SIGNAL: Activating Affine Cortex (SN120) for Critical Task...[/bold red]")
+            console.print(f"[dim]Prompt: {prompt[:50]}...[/dim]")
         
         # Simulate intense computation / RL search
         steps = ["Analyzing State Space...", "Pruning Decision Tree...", "Simulating Outcomes (Monte Carlo)...", "Optimizing Utility Function..."]
-        for step in steps:
-            time.sleep(0.8)
-            console.print(f"[magenta]  ➜ {step}[/magenta]")
+        if self.simulate_latency:
+            # One live progress line repainted per step instead of a print per step
+            with Progress(console=console, disable=not self.verbose) as progress:
+                task = progress.add_task("", total=len(steps))
+                for step in steps:
+                    progress.update(task, description=f"[magenta]  ➜ {step}[/magenta]")
+                    time.sleep(self.COMPUTE_STEP_LATENCY)
+                    progress.advance(task)
+        elif self.verbose:
+            console.print("\n".join(f"[magenta]  ➜ {step}[/magenta]" for step in steps))
             
         return f"Hyper-Logic Conclusion: Based on formal verification of {len(prompt)} tokens, the optimal strategy is derived. [Simulated Output for: {prompt}]"
 
     def _generate_feedback(self, task_type: str, valid: bool, score: float) -> str:
-        if task_type == "DED":
-            if valid:
-                return "Logical consistency confirmed. Deduction valid."
-            else:
-                return "Logical fallacy detected in premise 2. Deduction invalid."
-        elif task_type == "ABD":
-            if valid:
-                return "Hypothesis explains all observed phenomena. High probability."
-            else:
-                return "Hypothesis fails to account for edge case X."
-        elif task_type == "ARC":
-            if valid:
-                return "Pattern recognition successful. Transformation rule verified."
-            else:
-                return "Failed to generalize pattern to test set."
-        elif task_type == "CDE":
-             if valid:
-                return "Code output matches expected result. O(n) complexity."
-             else:
-                return "Runtime Error or outputs do not match."
-        return "Evaluation complete."
+        return _FEEDBACK.get((task_type, valid), "Evaluation complete.")
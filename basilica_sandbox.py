@@ -1,11 +1,15 @@
 import subprocess
-import json
+import asyncio
+import fast_json
 import time
 import os
 from rich.console import Console
+from config import verbose
 
 console = Console()
 
+SANDBOX_DOCKERFILE = "FROM python:3.9-slim\nCMD [\"sleep\", \"infinity\"]\n"
+
 class BasilicaSandbox:
     """
     Wraps the Basilica CLI ('bs') to manage a remote sandbox for code execution.
@@ -19,43 +23,89 @@ class BasilicaSandbox:
             "/usr/local/bin/bs",
             "/usr/local/bin/basilica"
         ]
+        # Resolve the binary and child environment once; every CLI call reuses them.
+        self.cmd_exe = next((p for p in self.cli_paths if os.path.exists(p)), "bs") # Default reliance on PATH
+        self._env = {**os.environ, "BASILICA_API_KEY": os.getenv("BASILICA_API_KEY", "")}
+        # (uid, timestamp) of the last successful lookup
+        self._uid_cache = (None, 0.0)
+        self.uid_cache_ttl = 5.0
+        # (connected, timestamp) of the last auth check
+        self._connection_cache = (False, 0.0)
+        self.connection_cache_ttl = 30.0
+        # OPENCLAW_VERBOSE=0 silences informational output (errors are always shown)
+        self.verbose = verbose()
 
-    def _run_cli(self, args):
+    def _run_cli(self, args, stdin_data=None):
         """Runs a Basilica CLI command and returns stdout."""
-        cmd_exe = "bs" # Default reliance on PATH
-        
-        for p in self.cli_paths:
-            if os.path.exists(p):
-                cmd_exe = p
-                break
-
         try:
-            cmd = [cmd_exe] + args
+            cmd = [self.cmd_exe] + args
             # print(f"Running: {' '.join(cmd)}") # Debug
                 
             result = subprocess.run(
                 cmd, 
                 capture_output=True, 
                 text=True, 
-                env={**os.environ, "BASILICA_API_KEY": os.getenv("BASILICA_API_KEY", "")}
+                env=self._env,
+                input=stdin_data
             )
             return result
         except Exception as e:
             return None
 
+    async def _run_cli_async(self, args, stdin_data=None):
+        """Async counterpart of _run_cli: lets many CLI invocations overlap on one thread."""
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                self.cmd_exe, *args,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                env=self._env
+            )
+            out, err = await proc.communicate(stdin_data.encode() if stdin_data is not None else None)
+            return subprocess.CompletedProcess([self.cmd_exe] + args, proc.returncode, out.decode(), err.decode())
+        except Exception as e:
+            return None
+
     def check_connection(self):
         """Checks if we can list resources (auth check)."""
-        res = self._run_cli(["ls", "--json"])
-        if res and res.returncode == 0:
+        connected, ts = self._connection_cache
+        if connected and time.monotonic() - ts < self.connection_cache_ttl:
             return True
-        return False
+
+        res = self._run_cli(["ls", "--json"])
+        connected = bool(res and res.returncode == 0)
+        self._connection_cache = (connected, time.monotonic())
+        return connected
 
     def get_sandbox_uid(self):
         """Finds the UID of the running sandbox deployment."""
+        uid, ts = self._uid_cache
+        if uid and time.monotonic() - ts < self.uid_cache_ttl:
+            return uid
+
+        uid = self._lookup_sandbox_uid()
+        self._uid_cache = (uid, time.monotonic()) if uid else (None, 0.0)
+        return uid
+
+    def _invalidate_uid(self):
+        self._uid_cache = (None, 0.0)
+
+    def _lookup_sandbox_uid(self):
+        """Queries the CLI for our deployment; returns its UID once Active with ready replicas."""
+        # Targeted lookup: the CLI returns one record instead of every deployment
+        res = self._run_cli(["deploy", "status", self.sandbox_name, "--json"])
+        if res and res.returncode == 0:
+            try:
+                return self._ready_instance(fast_json.loads(res.stdout))
+            except fast_json.JSONDecodeError:
+                return None
+
+        # Older CLIs without `deploy status`: scan the full listing
         res = self._run_cli(["deploy", "ls", "--json"])
         if res and res.returncode == 0:
             try:
-                data = json.loads(res.stdout)
+                data = fast_json.loads(res.stdout)
                 # It returns a dict like {"deployments": [], "total": 0}
                 if isinstance(data, dict):
                     deployments = data.get("deployments", [])
@@ -64,32 +114,24 @@ class BasilicaSandbox:
                 else:
                     deployments = []
                     
+                # The listing has no `name` field (keys: instanceName, state, url, replicas,
+                # createdAt, public), so take the first Active one; we only deploy one sandbox.
                 for dep in deployments:
-                    # Check for name match
-                    # Some versions might use 'name' or not show it in list directly but 'instanceName' is unique
-                    # If we deployed with --name openclaw-test, does it show up?
-                    # The example output doesn't show "name": "openclaw-test". It shows "public": true etc.
-                    # Maybe it's not showing the name we gave it?
-                    # Let's assume if there's only one deployment or if we just pick the first Active one for now?
-                    # Or check if we can filter by name in CLI?
-                    # The CLI usage says `bs deploy ls` lists all.
-                    # The example output keys: instanceName, state, url, replicas, createdAt, public.
-                    # It seems `name` is NOT in the output? That's annoying.
-                    # But we only deploy one sandbox usually.
-                    # Let's verify if we can match by name or if we should just take the Active one.
-                    # Actually, we can use `bs deploy status <NAME>` maybe?
-                    # Usage: `bs deploy status [aliases: get]`.
-                    # Let's try `bs deploy get <NAME> --json` instead of ls?
-                    
-                    if dep.get("state") == "Active":
-                         replicas = dep.get("replicas", {})
-                         ready = replicas.get("ready", 0)
-                         if ready > 0:
-                             return dep.get("instanceName")
-            except json.JSONDecodeError:
+                    uid = self._ready_instance(dep)
+                    if uid:
+                        return uid
+            except fast_json.JSONDecodeError:
                 pass
         return None
 
+    @staticmethod
+    def _ready_instance(dep):
+        """Returns the instanceName of a deployment record that is Active with ready replicas."""
+        if isinstance(dep, dict) and dep.get("state") == "Active":
+            if dep.get("replicas", {}).get("ready", 0) > 0:
+                return dep.get("instanceName")
+        return None
+
     def ensure_sandbox_running(self):
         """Ensures the sandbox deployment exists and is running."""
         uid = self.get_sandbox_uid()
@@ -103,9 +145,7 @@ class BasilicaSandbox:
         # Or just tell user to run from a dir?
         # Simplest: create a 'sandbox' dir
         sandbox_dir = os.path.join(os.getcwd(), "sandbox_build")
-        os.makedirs(sandbox_dir, exist_ok=True)
-        with open(os.path.join(sandbox_dir, "Dockerfile"), "w") as f:
-            f.write("FROM python:3.9-slim\nCMD [\"sleep\", \"infinity\"]\n")
+        self._write_dockerfile(sandbox_dir)
 
         res = self._run_cli([
             "deploy", 
@@ -118,20 +158,41 @@ class BasilicaSandbox:
         ])
         
         if res and res.returncode == 0:
-            console.print("[green]🚀 Sandbox deployment initiated.[/green]")
-            # Wait for it to be ready (naive wait)
-            for _ in range(12): # Wait up to 60s
-                time.sleep(5)
+            if self.verbose:
+                console.print("[green]🚀 Sandbox deployment initiated.[/green]")
+            # Wait for it to be ready: poll early and back off, so fast deploys are seen at once
+            delay = 0.25
+            deadline = time.monotonic() + 60 # Wait up to 60s
+            if self.verbose:
+                console.print("[dim]Waiting for sandbox...[/dim]")
+            while True:
                 uid = self.get_sandbox_uid()
                 if uid:
-                    console.print(f"[green]✅ Sandbox ready: {uid}[/green]")
+                    if self.verbose:
+                        console.print(f"[green]✅ Sandbox ready: {uid}[/green]")
                     return uid
-                console.print("[dim]Waiting for sandbox...[/dim]")
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                time.sleep(min(delay, remaining))
+                delay = min(delay * 1.7, 5.0)
         else:
             console.print(f"[red]❌ Failed to deploy sandbox:[/red] {res.stderr if res else 'Unknown error'}")
         
         return None
 
+    def _write_dockerfile(self, sandbox_dir):
+        """Writes the sandbox Dockerfile, skipping the write when it is already up to date."""
+        path = os.path.join(sandbox_dir, "Dockerfile")
+        try:
+            with open(path, "r") as f:
+                if f.read() == SANDBOX_DOCKERFILE:
+                    return
+        except FileNotFoundError:
+            os.makedirs(sandbox_dir, exist_ok=True)
+        with open(path, "w") as f:
+            f.write(SANDBOX_DOCKERFILE)
+
     def execute_code(self, code):
         """Executes Python code in the remote sandbox."""
         uid = self.get_sandbox_uid()
@@ -141,21 +202,37 @@ class BasilicaSandbox:
             if not uid:
                 return "Error: Sandbox not available."
 
-        # Escape code for shell
-        # We wrap it in safe execution
-        # Note: 'bs exec' might behave differently than docker exec regarding quoting
-        # Best to write to a file then run? 
-        # bs exec doesn't easily support heredoc? 
-        # Let's try simple python -c
-        
-        console.print(f"[dim]Executing in {uid}...[/dim]")
-        # Escape quotes in code for the shell command
-        safe_code = code.replace('"', '\\"').replace("'", "\\'")
-        
-        # bs exec <uid> -- python -c "..."
-        res = self._run_cli(["exec", uid, "--", "python", "-c", code])
+        # Feed the source through stdin to `python -`: no quoting, no argv size limits.
+        if self.verbose:
+            console.print(f"[dim]Executing in {uid}...[/dim]")
         
+        # bs exec <uid> -- python - < code
+        res = self._run_cli(["exec", uid, "--", "python", "-"], stdin_data=code)
+        return self._exec_output(res)
+
+    async def execute_code_many(self, codes):
+        """
+        Executes several Python snippets in the remote sandbox concurrently.
+        Returns one output (or "Error: ..." string) per snippet, in order.
+        """
+        uid = await asyncio.to_thread(self.get_sandbox_uid)
+        if not uid:
+            uid = await asyncio.to_thread(self.ensure_sandbox_running)
+            if not uid:
+                return ["Error: Sandbox not available."] * len(codes)
+
+        if self.verbose:
+            console.print(f"[dim]Executing {len(codes)} snippets in {uid}...[/dim]")
+        results = await asyncio.gather(*(
+            self._run_cli_async(["exec", uid, "--", "python", "-"], stdin_data=code)
+            for code in codes
+        ))
+        return [self._exec_output(res) for res in results]
+
+    def _exec_output(self, res):
         if res and res.returncode == 0:
             return res.stdout
         else:
+            # The sandbox may have gone away; force a fresh lookup next time.
+            self._invalidate_uid()
             return f"Error: {res.stderr if res else 'CLI execution failed'}"
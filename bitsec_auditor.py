@@ -1,6 +1,11 @@
 import os
+import asyncio
+import hashlib
+import fast_json
 import requests
-from typing import Dict, Any
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, List
 
 class BitsecAuditor:
     """
@@ -12,6 +17,22 @@ class BitsecAuditor:
         # Placeholder URL
         self.base_url = os.getenv("BITSEC_API_URL", "https://api.bitsec.tensor/v1")
 
+        # Keep-alive session: repeated audits reuse the TCP/TLS connection
+        self.session = requests.Session()
+        self.session.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        })
+        # Upper bound on in-flight scans for audit_many; sized to the connection pool
+        self.max_concurrency = 8
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.max_concurrency, max_retries=Retry(total=1, backoff_factor=0.2))
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+        # blake2b(code) -> True or the SecurityException it raised; only definitive verdicts are kept
+        self._audit_cache = {}
+        self.audit_cache_size = 512
+
     def audit(self, code: str) -> bool:
         """
         Scans code. Returns True if safe, raises SecurityException if unsafe.
@@ -20,25 +41,32 @@ class BitsecAuditor:
             print("[Bitsec] API Key missing. Skipping audit (Unsafe Mode).")
             return True
 
+        key = hashlib.blake2b(code.encode(), digest_size=16).digest()
+        cached = self._audit_cache.get(key)
+        if cached is not None:
+            if isinstance(cached, SecurityException):
+                # Fresh instance so repeated hits don't grow one shared traceback
+                raise SecurityException(str(cached), cached.issues)
+            return cached
+
         try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
             payload = {"code": code, "language": "python"}
             
             print(f"[Bitsec] Auditing {len(code)} bytes of code...")
-            resp = requests.post(f"{self.base_url}/scan", json=payload, headers=headers, timeout=10)
+            resp = self.session.post(f"{self.base_url}/scan", json=payload, timeout=10)
             
             if resp.status_code == 200:
-                report = resp.json()
+                report = fast_json.loads(resp.content)
                 risk = report.get("risk_level", "UNKNOWN")
                 
                 if risk == "HIGH" or risk == "CRITICAL":
                     issues = report.get("issues", [])
-                    raise SecurityException(f"Bitsec Output: Code rejected due to {len(issues)} high-risk issues.", issues)
+                    rejection = SecurityException(f"Bitsec Output: Code rejected due to {len(issues)} high-risk issues.", issues)
+                    self._remember(key, rejection)
+                    raise rejection
                 
                 print(f"[Bitsec] Audit Passed (Risk: {risk}).")
+                self._remember(key, True)
                 return True
             else:
                 print(f"[Bitsec] Scan failed ({resp.status_code}). Allow-listing for now.")
@@ -50,6 +78,26 @@ class BitsecAuditor:
             print(f"[Bitsec] Error contacting auditor: {e}. Defaulting to unsafe execution.")
             return True
 
+    def _remember(self, key: bytes, verdict):
+        if len(self._audit_cache) >= self.audit_cache_size:
+            # Evict the oldest entry (dicts keep insertion order)
+            self._audit_cache.pop(next(iter(self._audit_cache)), None)
+        self._audit_cache[key] = verdict
+
+    async def audit_many(self, codes: List[str]) -> List[Any]:
+        """
+        Audits several code fragments concurrently over the pooled session.
+        Returns one entry per fragment, in order: True if it passed, or the
+        SecurityException that rejected it.
+        """
+        limit = asyncio.Semaphore(self.max_concurrency)
+
+        async def _audit(code):
+            async with limit:
+                return await asyncio.to_thread(self.audit, code)
+
+        return await asyncio.gather(*(_audit(code) for code in codes), return_exceptions=True)
+
 class SecurityException(Exception):
     def __init__(self, message, issues=None):
         super().__init__(message)
@@ -1,28 +1,59 @@
 import os
-import json
+import re
+import fast_json
 import time
+import mmap
+import asyncio
+import importlib
+from functools import lru_cache
 from rich.console import Console
 from openai import Client
-from stealth_browser import StealthBrowser
-from bitsec_auditor import BitsecAuditor
-from gopher_client import GopherClient
+from config import verbose
 
 console = Console()
 
-from handshake_consultant import HandshakeConsultant
 
-from soul_manager import SoulManager
-
-from context_loader import ContextLoader
-
-from gittensor_client import GittensorClient
-
-from macrocosm_client import MacrocosmClient
-
-from affine_client import AffineClient
-
-from taoshi_client import TaoshiClient
-from src.tools.manako_vision import ManakoVision
+def _lazy(module: str, class_name: str):
+    """Factory that imports `module` on first use and instantiates `class_name`."""
+    def factory():
+        return getattr(importlib.import_module(module), class_name)()
+    return factory
+
+
+# Subnet modules resolved lazily by BrainRouter.__getattr__.
+# Nothing is imported until first access, so `import brain` stays cheap.
+_FACTORIES = {
+    "stealth_browser": _lazy("stealth_browser", "StealthBrowser"),
+    "bitsec_auditor": _lazy("bitsec_auditor", "BitsecAuditor"),
+    "gopher_client": _lazy("gopher_client", "GopherClient"),
+    "handshake_consultant": _lazy("handshake_consultant", "HandshakeConsultant"),
+    # v2.4 Modules
+    "soul_manager": _lazy("soul_manager", "SoulManager"),
+    # v2.5 Modules (Data Layer)
+    "context_loader": _lazy("context_loader", "ContextLoader"),
+    # v2.6 Modules (Contributor Layer)
+    "gittensor_client": _lazy("gittensor_client", "GittensorClient"),
+    # v2.7 Modules (Compute Layer)
+    "macrocosm_client": _lazy("macrocosm_client", "MacrocosmClient"),
+    # v2.8 Modules (Verifier Layer)
+    "affine_client": _lazy("affine_client", "AffineClient"),
+    # v2.9 Modules (Finance Layer)
+    "taoshi_client": _lazy("taoshi_client", "TaoshiClient"),
+    # v2.10 Modules (Vision Layer)
+    "manako_vision": _lazy("src.tools.manako_vision", "ManakoVision"),
+}
+
+# Complexity heuristics, compiled once: one C-level scan per tier instead of N substring sweeps.
+_INSANE_KEYWORDS = ("critical", "architect", "hyper", "supreme")
+_HIGH_KEYWORDS = ("plan", "analyze", "analysis", "code", "context", "history", "research", "deep")
+_GROUNDING_KEYWORDS = ("history", "context", "deep", "research")
+
+def _keyword_pattern(keywords):
+    return re.compile("|".join(map(re.escape, keywords)), re.IGNORECASE)
+
+_INSANE_RE = _keyword_pattern(_INSANE_KEYWORDS)
+_HIGH_RE = _keyword_pattern(_HIGH_KEYWORDS)
+_GROUNDING_RE = _keyword_pattern(_GROUNDING_KEYWORDS)
 
 class BrainRouter:
     """
@@ -35,6 +66,14 @@ class BrainRouter:
         self.chutes_key = os.getenv("CHUTES_API_KEY")
         self.targon_key = os.getenv("TARGON_API_KEY")
         self.vanta_key = os.getenv("VANTA_API_KEY")
+
+        # Model names, resolved once rather than per call on the think() hot path
+        self._chutes_model = os.getenv("CHUTES_MODEL", "chutes/nousresearch/hermes-3-llama-3.1-405b")
+        self._chutes_model_tee = "chutes/kimi-k2.5-tee"
+        self._targon_model = os.getenv("TARGON_MODEL", "deepseek-ai/DeepSeek-R1")
+
+        # OPENCLAW_VERBOSE=0 silences informational output (errors are always shown)
+        self.verbose = verbose()
         
         # 2. Clients
         self.chutes_client = None
@@ -47,47 +86,55 @@ class BrainRouter:
         if self.targon_key:
             self.targon_client = Client(api_key=self.targon_key, base_url="https://api.targon.com/v1")
 
-        # 3. Subnet Modules
-        self.stealth_browser = StealthBrowser()
-        self.bitsec_auditor = BitsecAuditor()
-        self.gopher_client = GopherClient()
-        self.handshake_consultant = HandshakeConsultant()
-
-        
-        # v2.4 Modules
-        self.soul_manager = SoulManager()
+        # 3. Subnet Modules are built on first access (see __getattr__).
         self.system_prompt = self.soul_manager.load_soul()
-        
-        # v2.5 Modules (Data Layer)
-        self.context_loader = ContextLoader()
-        
-        # v2.6 Modules (Contributor Layer)
-        self.gittensor_client = GittensorClient()
-        
-        # v2.7 Modules (Compute Layer)
-        self.macrocosm_client = MacrocosmClient()
-        
-        # v2.8 Modules (Verifier Layer)
-        self.affine_client = AffineClient()
-        
-        # v2.9 Modules (Finance Layer)
-        # v2.9 Modules (Finance Layer)
-        self.taoshi_client = TaoshiClient()
 
-        # v2.10 Modules (Vision Layer)
-        self.manako_vision = ManakoVision()
+        # (file stamp, limit, signals) of the last vanta_signals.json read
+        self._vanta_cache = (None, 0, [])
 
-    # ... existing methods ...
+        # topic -> (timestamp, grounding text) from the Data Universe
+        self._grounding_cache = {}
+        self.grounding_ttl = 300.0
+
+    def __getattr__(self, name):
+        """Builds a subnet module on first access and caches it on the instance."""
+        factory = _FACTORIES.get(name)
+        if factory is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+        obj = factory()
+        object.__setattr__(self, name, obj)
+        return obj
 
     # ... existing methods ...
 
+    @staticmethod
+    def _iter_deltas(stream):
+        """Yields the text deltas of a streamed chat completion as they arrive."""
+        for event in stream:
+            if event.choices:
+                delta = event.choices[0].delta.content
+                if delta:
+                    yield delta
+
+    def _consume_stream(self, stream) -> str:
+        """Echoes a streamed completion token-by-token and returns the full text."""
+        chunks = []
+        for delta in self._iter_deltas(stream):
+            if self.verbose:
+                console.print(delta, end="", markup=False, highlight=False)
+            chunks.append(delta)
+        if chunks and self.verbose:
+            console.print()
+        return "".join(chunks)
+
     def _system_1_fast_response(self, prompt: str, is_sensitive: bool = False) -> str:
         """
         System 1: Fast, cheap, conversational. Use Chutes (SN64).
         If is_sensitive is True, requests a TEE (Trusted Execution Environment).
         """
         mode_label = "🔒 SECURE MODE (TEE)" if is_sensitive else "⚡ Fast Mode"
-        console.print(f"[cyan]{mode_label} System 1 (Chutes SN64) activated...[/cyan]")
+        if self.verbose:
+            console.print(f"[cyan]{mode_label} System 1 (Chutes SN64) activated...[/cyan]")
         
         if not self.chutes_client:
             return "[Mock] Chutes key missing. Response: " + prompt
@@ -95,17 +142,18 @@ class BrainRouter:
         try:
             # Use configurable model or fallback to a known potentially valid one
             # Conceptual: In a real SDK, we would pass 'tier="tee"' or similar
-            model_name = "chutes/kimi-k2.5-tee" if is_sensitive else os.getenv("CHUTES_MODEL", "chutes/nousresearch/hermes-3-llama-3.1-405b")
+            model_name = self._chutes_model_tee if is_sensitive else self._chutes_model
             
-            response = self.chutes_client.chat.completions.create(
+            stream = self.chutes_client.chat.completions.create(
                 model=model_name, 
                 messages=[
                     {"role": "system", "content": self.system_prompt},
                     {"role": "user", "content": prompt}
                 ],
-                max_tokens=200
+                max_tokens=200,
+                stream=True
             )
-            return response.choices[0].message.content
+            return self._consume_stream(stream)
         except Exception as e:
             console.print(f"[red]Error contacting Chutes: {e}[/red]")
             return f"[Fallback] Fast response to: {prompt}"
@@ -115,14 +163,15 @@ class BrainRouter:
         System 2: Deep, reasoning, strategic. Use Targon (SN4).
         Now augmented with Sovereign v2.5 Data Layer (Nexus).
         """
-        console.print("[magenta]🧠 System 2 (Targon SN4) activated...[/magenta]")
+        if self.verbose:
+            console.print("[magenta]🧠 System 2 (Targon SN4) activated...[/magenta]")
         
         # Sovereign v2.5: Grounding Phase
         # Heuristic: Check if prompt needs deep context
-        if "history" in prompt.lower() or "context" in prompt.lower() or "deep" in prompt.lower() or "research" in prompt.lower():
+        if _GROUNDING_RE.search(prompt):
              # Basic topic extraction (first 50 chars or user cue)
              topic = prompt[:50]
-             grounding_data = self.context_loader.get_deep_context(topic)
+             grounding_data = self._get_grounding(topic)
              # Augment the prompt with grounded truth
              prompt = f"Context from Data Universe (SN13/SN74):\n{grounding_data}\n\nUser Question:\n{prompt}"
         
@@ -131,22 +180,34 @@ class BrainRouter:
 
         try:
             # Targon often requires specific parameters or models
-            model_name = os.getenv("TARGON_MODEL", "deepseek-ai/DeepSeek-R1")
+            model_name = self._targon_model
             
-            response = self.targon_client.chat.completions.create(
+            stream = self.targon_client.chat.completions.create(
                 model=model_name, 
                 messages=[
                     {"role": "system", "content": self.system_prompt},
                     {"role": "user", "content": prompt}
                 ],
-                max_tokens=6000 # Deep thought needs tokens
+                max_tokens=6000, # Deep thought needs tokens
+                stream=True
             )
-            return response.choices[0].message.content
+            return self._consume_stream(stream)
         except Exception as e:
             console.print(f"[red]Error contacting Targon ({e}). Falling back to System 1...[/red]")
             return self._system_1_fast_response(prompt)
 
 
+    def _get_grounding(self, topic: str) -> str:
+        """Returns Data Universe context for a topic, reusing results younger than grounding_ttl."""
+        now = time.monotonic()
+        cached = self._grounding_cache.get(topic)
+        if cached and now - cached[0] < self.grounding_ttl:
+            return cached[1]
+
+        grounding_data = self.context_loader.get_deep_context(topic)
+        self._grounding_cache[topic] = (now, grounding_data)
+        return grounding_data
+
     # ... existing methods ...
 
     def _system_3_cortex_thought(self, prompt: str) -> str:
@@ -154,7 +215,8 @@ class BrainRouter:
         System 3: Hyper-Logic, Critical Decision. Use Affine Cortex (SN120).
         The 'Supreme Judge' protocol.
         """
-        console.print("[bold red]🧠 NEXUS SIGNAL: Activating Affine Cortex (SN120) - Protocolo do Arquiteto...[/bold red]")
+        if self.verbose:
+            console.print("[bold red]🧠 NEXUS SIGNAL: Activating Affine Cortex (SN120) - Protocolo do Arquiteto...[/bold red]")
         
         try:
             return self.affine_client.compute(prompt)
@@ -168,36 +230,13 @@ class BrainRouter:
         """
         return self.handshake_consultant.consult(query)
 
-        self.chutes_key = os.getenv("CHUTES_API_KEY")
-        self.targon_key = os.getenv("TARGON_API_KEY")
-        
-        # Initialize clients lazily to allow for missing keys during dev
-        self.chutes_client = None
-        self.targon_client = None
-
-        # v2.2 Modules
-        self.stealth_browser = StealthBrowser()
-        self.bitsec_auditor = BitsecAuditor()
-        self.gopher_client = GopherClient()
-        
-        if self.chutes_key:
-            self.chutes_client = Client(
-                api_key=self.chutes_key,
-                base_url="https://llm.chutes.ai/v1" 
-            )
-        
-        if self.targon_key:
-            self.targon_client = Client(
-                api_key=self.targon_key,
-                base_url="https://api.targon.com/v1" 
-            )
-
     def think(self, prompt: str, is_sensitive: bool = False) -> str:
         """
         Analyzes the prompt complexity and routes to the appropriate subnet.
         """
         if is_sensitive:
-             console.print("[bold yellow]🔒 SECURE PROTOCOL: Forcing Chutes (SN64) TEE Enclave...[/bold yellow]")
+             if self.verbose:
+                 console.print("[bold yellow]🔒 SECURE PROTOCOL: Forcing Chutes (SN64) TEE Enclave...[/bold yellow]")
              return self._system_1_fast_response(prompt, is_sensitive=True)
 
         complexity = self._evaluate_complexity(prompt)
@@ -211,14 +250,13 @@ class BrainRouter:
 
     def _evaluate_complexity(self, prompt: str) -> str:
         # Heuristic v2.6 (Cortex Edition)
-        if "critical" in prompt.lower() or "architect" in prompt.lower() or "hyper" in prompt.lower() or "supreme" in prompt.lower():
+        if _INSANE_RE.search(prompt):
             return "insane"
             
         if len(prompt) > 100:
             return "high"
             
-        keywords = ["plan", "analyze", "analysis", "code", "context", "history", "research", "deep"]
-        if any(k in prompt.lower() for k in keywords):
+        if _HIGH_RE.search(prompt):
             return "high"
             
         return "low"
@@ -228,7 +266,8 @@ class BrainRouter:
 
     def browse(self, url: str):
         """Uses RedTeam stealth browser to fetch content."""
-        console.print(f"[green]🕵️ RedTeam Stealth Browsing: {url}...[/green]")
+        if self.verbose:
+            console.print(f"[green]🕵️ RedTeam Stealth Browsing: {url}...[/green]")
         try:
             return self.stealth_browser.browse(url)
         except Exception as e:
@@ -237,7 +276,8 @@ class BrainRouter:
 
     def audit_code(self, code: str) -> bool:
         """Uses Bitsec to audit code safety."""
-        console.print("[yellow]🛡️ Bitsec Auditing Code...[/yellow]")
+        if self.verbose:
+            console.print("[yellow]🛡️ Bitsec Auditing Code...[/yellow]")
         try:
             return self.bitsec_auditor.audit(code)
         except Exception as e:
@@ -246,7 +286,8 @@ class BrainRouter:
 
     def search_web(self, url: str) -> list:
         """Uses Gopher (SN42) to scrape and index a URL."""
-        console.print(f"[blue]Gopher: Indexing {url}...[/blue]")
+        if self.verbose:
+            console.print(f"[blue]Gopher: Indexing {url}...[/blue]")
         try:
             return self.gopher_client.scrape(url)
         except Exception as e:
@@ -257,7 +298,8 @@ class BrainRouter:
         """
         Uses Manako (SN44) to analyze images or videos.
         """
-        console.print(f"[magenta]👁️ Manako Vision: Analyzing {media_url}...[/magenta]")
+        if self.verbose:
+            console.print(f"[magenta]👁️ Manako Vision: Analyzing {media_url}...[/magenta]")
         try:
             return self.manako_vision.look_at(media_url, query)
         except Exception as e:
@@ -268,7 +310,8 @@ class BrainRouter:
         """
         Uses Gittensor (SN74) to find an issue and propose a fix.
         """
-        console.print("[cyan]🐙 Gittensor Agent: Searching for contribution opportunities...[/cyan]")
+        if self.verbose:
+            console.print("[cyan]🐙 Gittensor Agent: Searching for contribution opportunities...[/cyan]")
         try:
             opportunity = self.gittensor_client.find_opportunity(repo_name)
             if "error" in opportunity:
@@ -288,12 +331,14 @@ class BrainRouter:
         """
         Offloads heavy computation to Macrocosm OS (SN25).
         """
-        console.print(f"[magenta]🌌 Macrocosm Agent: Requesting Heavy Compute for {task_type}...[/magenta]")
+        if self.verbose:
+            console.print(f"[magenta]🌌 Macrocosm Agent: Requesting Heavy Compute for {task_type}...[/magenta]")
         try:
             job_id = self.macrocosm_client.dispatch_job(task_type, payload)
             
             # Simulate waiting for result
-            console.print(f"[dim]Waiting for distributed completion (Job {job_id})...[/dim]")
+            if self.verbose:
+                console.print(f"[dim]Waiting for distributed completion (Job {job_id})...[/dim]")
             time.sleep(2.5) 
             
             result = self.macrocosm_client.check_status(job_id)
@@ -310,22 +355,57 @@ class BrainRouter:
         Verifies reasoning using Affine Cortex (SN??).
         Example task_types: DED (Deduction), ABD (Abduction), ARC (Pattern).
         """
-        console.print(f"[magenta]🧠 Affine Cortex: Verifying thought in {task_type} environment...[/magenta]")
+        if self.verbose:
+            console.print(f"[magenta]🧠 Affine Cortex: Verifying thought in {task_type} environment...[/magenta]")
         try:
-            result = self.affine_client.verify_thought(thought, task_type)
-            
-            if "error" in result:
-                return f"Affine Error: {result['error']}"
-            
-            status = "VALID" if result.get("valid") else "INVALID"
-            score = result.get("score", 0.0)
-            feedback = result.get("feedback", "No feedback.")
-            
-            return f"Verification Result ({status}): Score {score:.2f}. Feedback: {feedback}"
+            return self._format_verification(self.affine_client.verify_thought(thought, task_type))
+        except Exception as e:
+            console.print(f"[red]Affine Verification failed: {e}[/red]")
+            return "Verification failed."
+
+    @staticmethod
+    def _format_verification(result: dict) -> str:
+        if "error" in result:
+            return f"Affine Error: {result['error']}"
+        
+        status = "VALID" if result.get("valid") else "INVALID"
+        score = result.get("score", 0.0)
+        feedback = result.get("feedback", "No feedback.")
+        
+        return f"Verification Result ({status}): Score {score:.2f}. Feedback: {feedback}"
+
+    # Async variants: blocking adapters run in worker threads so callers can
+    # asyncio.gather independent steps (latency = max instead of sum).
+
+    async def audit_code_async(self, code: str) -> bool:
+        return await asyncio.to_thread(self.audit_code, code)
+
+    async def browse_async(self, url: str):
+        return await asyncio.to_thread(self.browse, url)
+
+    async def search_web_async(self, url: str) -> list:
+        return await asyncio.to_thread(self.search_web, url)
+
+    async def see_async(self, media_url: str, query: str = None) -> str:
+        return await asyncio.to_thread(self.see, media_url, query)
+
+    async def verify_thought_async(self, thought: str, task_type: str = "DED") -> str:
+        if self.verbose:
+            console.print(f"[magenta]🧠 Affine Cortex: Verifying thought in {task_type} environment...[/magenta]")
+        try:
+            return self._format_verification(await self.affine_client.verify_thought_async(thought, task_type))
         except Exception as e:
             console.print(f"[red]Affine Verification failed: {e}[/red]")
             return "Verification failed."
 
+    async def pipeline(self, code: str, url: str, thought: str) -> list:
+        """Audits code, browses a URL and verifies a thought concurrently; returns results in that order."""
+        return await asyncio.gather(
+            self.audit_code_async(code),
+            self.browse_async(url),
+            self.verify_thought_async(thought)
+        )
+
     def get_market_sentiment(self, limit=10) -> list:
         """
         Retrieves latest financial signals from Vanta Network (SN).
@@ -336,8 +416,7 @@ class BrainRouter:
             return ["No active market signals found. Is vanta_observer running?"]
         
         try:
-            with open(signal_file, "r") as f:
-                signals = json.load(f)
+            signals = self._read_signals(signal_file, limit)
             
             # Format signals for the brain
             summary = []
@@ -348,3 +427,47 @@ class BrainRouter:
         except Exception as e:
             console.print(f"[red]Error reading Vanta signals: {e}[/red]")
             return []
+
+    def _read_signals(self, signal_file: str, limit: int) -> list:
+        """
+        Returns the last `limit` signals, re-parsing only when the file changes.
+        Handles both the JSON array written by vanta_observer.py and an
+        append-only JSON-lines variant, where only the tail records are decoded.
+        """
+        st = os.stat(signal_file)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached_stamp, cached_limit, cached = self._vanta_cache
+        if cached_stamp == stamp and cached_limit >= limit:
+            return cached[-limit:]
+
+        if st.st_size == 0:
+            return []
+
+        with open(signal_file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm[:64].lstrip().startswith(b"["):
+                signals = fast_json.loads(mm[:])[-limit:]
+            else:
+                signals = [fast_json.loads(line) for line in self._tail_lines(mm, limit)]
+
+        self._vanta_cache = (stamp, limit, signals)
+        return signals
+
+    @staticmethod
+    def _tail_lines(mm, n: int) -> list:
+        """Scans a memory-mapped file backwards for its last `n` non-empty lines."""
+        lines = []
+        end = len(mm)
+        while end > 0 and len(lines) < n:
+            start = mm.rfind(b"\n", 0, end) + 1
+            line = mm[start:end].strip()
+            if line:
+                lines.append(line)
+            end = start - 1
+        lines.reverse()
+        return lines
+
+
+@lru_cache(maxsize=1)
+def get_brain() -> BrainRouter:
+    """Process-wide BrainRouter, built on first call; scripts run together share it."""
+    return BrainRouter()
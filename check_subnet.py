@@ -1,38 +1,81 @@
 #!/usr/bin/env python3
 import argparse
-import time
+import asyncio
 import json
 import sys
 import os
-from dotenv import load_dotenv
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
-from rich import box
-from mcp_client import MCPClient
 
-def format_currency(value_str):
-    if not value_str: return "N/A"
-    try:
-        val = float(value_str)
-        return f"${val:,.4f}"
-    except:
-        return value_str
+# (label, key, kind) rows for the Key Metrics / Network Details tables.
+# kind: "$" currency, "num" plain number, "raw" shown as-is
+METRIC_ROWS = (
+    ("Market Cap", "market_cap", "$"),
+    ("Liquidity", "liquidity", "$"),
+    ("24h Volume", "tao_volume_24_hr", "$"),
+    ("24h Buys", "buys_24_hr", "raw"),
+    ("24h Sells", "sells_24_hr", "raw"),
+    ("24h Buyers", "buyers_24_hr", "raw"),
+    ("24h Sellers", "sellers_24_hr", "raw"),
+)
+DETAIL_ROWS = (
+    ("Block Number", "block_number", "raw"),
+    ("Total TAO", "total_tao", "num"),
+    ("Total Alpha", "total_alpha", "num"),
+)
+
+_FORMATS = {"$": "${:,.4f}".format, "num": "{:,.2f}".format}
 
-def format_number(value_str):
-    if not value_str: return "N/A"
+def fmt(value, kind):
+    """Formats one table value; non-numeric strings are shown unchanged."""
+    if kind == "raw":
+        return str(value)
+    if not value:
+        return "N/A"
     try:
-        val = float(value_str)
-        return f"{val:,.2f}"
-    except:
-        return value_str
+        return _FORMATS[kind](float(value))
+    except (TypeError, ValueError):
+        return value
+
+def build_metrics_table():
+    """
+    Returns an empty Key Metrics table with its styled columns in place.
+    Rich keeps cell data on private per-column state, so callers get a fresh
+    skeleton per render rather than a cleared shared instance.
+    """
+    from rich.table import Table
+    from rich import box
+
+    table = Table(title="Key Metrics", box=box.ROUNDED, show_header=True, header_style="bold magenta")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Value", style="bold white")
+    return table
+
+async def fetch_subnet_pool(url, netuid, console):
+    """
+    Opens an MCP session and fetches GetLatestSubnetPool for `netuid`.
+    Returns (connected, result).
+    """
+    from mcp_client import MCPClient
+
+    # connect() returns once the session is initialized and call_tool awaits the reply,
+    # so no settling delays are needed around them.
+    async with MCPClient(url) as client:
+        if not await client.connect():
+            return False, None
+        with console.status(f"[bold green]Fetching data for Subnet {netuid}...[/bold green]"):
+            return True, await client.call_tool("GetLatestSubnetPool", {"netuid": netuid})
 
 def main():
     parser = argparse.ArgumentParser(description="Check Bittensor Subnet Metrics via Taostats MCP")
     parser.add_argument("netuid", type=int, help="The Subnet NetUID (e.g., 33 for ReadyAI)")
     args = parser.parse_args()
 
+    # Heavy imports come after argument parsing so `-h` and usage errors return instantly
+    from dotenv import load_dotenv
+    from rich.console import Console
+    from rich.table import Table
+    from rich.panel import Panel
+    from rich import box
+
     load_dotenv()
     url = os.getenv("TAOSTATS_MCP_URL")
     if not url:
@@ -42,16 +85,9 @@ def main():
     console = Console()
     console.print(f"[bold blue]Connecting to Taostats MCP...[/bold blue] (Target: Subnet {args.netuid})")
     
-    client = MCPClient(url)
+    connected, result = asyncio.run(fetch_subnet_pool(url, args.netuid, console))
     
-    if client.connect():
-        # Give it a moment to stabilize the connection
-        time.sleep(1)
-        
-        with console.status(f"[bold green]Fetching data for Subnet {args.netuid}...[/bold green]"):
-            result = client.call_tool("GetLatestSubnetPool", {"netuid": args.netuid})
-            time.sleep(1) # simulate/wait for network slightly if needed, though call_tool is blocking now
-
+    if connected:
         if result and "content" in result and len(result["content"]) > 0:
             content = result["content"][0]
             if content.get("type") == "text":
@@ -68,40 +104,26 @@ def main():
                     console.print(Panel(title, subtitle=f"Symbol: {symbol}", expand=False, border_style="blue"))
                     
                     # Key Metrics Table
-                    table = Table(title="Key Metrics", box=box.ROUNDED, show_header=True, header_style="bold magenta")
-                    table.add_column("Metric", style="cyan")
-                    table.add_column("Value", style="bold white")
+                    table = build_metrics_table()
                     
                     # Highlighted metrics
-                    price = format_currency(data.get('price', '0'))
+                    price = fmt(data.get('price', '0'), "$")
                     price_change = data.get('price_change_1_day', '0%')
                     p_color = "green" if not price_change.startswith("-") else "red"
                     
                     table.add_row("Price", f"[gold1]{price}[/gold1] ([{p_color}]{price_change}[/{p_color}])")
-                    table.add_row("Market Cap", format_currency(data.get('market_cap', '0')))
-                    table.add_row("Liquidity", format_currency(data.get('liquidity', '0')))
-                    table.add_row("24h Volume", format_currency(data.get('tao_volume_24_hr', '0')))
-                    
-                    # 24h Activity
-                    table.add_row("24h Buys", str(data.get('buys_24_hr', '0')))
-                    table.add_row("24h Sells", str(data.get('sells_24_hr', '0')))
-                    table.add_row("24h Buyers", str(data.get('buyers_24_hr', '0')))
-                    table.add_row("24h Sellers", str(data.get('sellers_24_hr', '0')))
+                    for label, key, kind in METRIC_ROWS:
+                        table.add_row(label, fmt(data.get(key, '0'), kind))
                     
                     console.print(table)
                     
                     # Details Table
-                    grid = Table.grid(expand=True)
-                    grid.add_column()
-                    grid.add_column(justify="right")
-                    
                     d_table = Table(title="Network Details", box=box.SIMPLE)
                     d_table.add_column("Property", style="dim")
                     d_table.add_column("Value")
                     
-                    d_table.add_row("Block Number", str(data.get('block_number')))
-                    d_table.add_row("Total TAO", format_number(data.get('total_tao')))
-                    d_table.add_row("Total Alpha", format_number(data.get('total_alpha')))
+                    for label, key, kind in DETAIL_ROWS:
+                        d_table.add_row(label, fmt(data.get(key), kind))
                     d_table.add_row("Recycle/Registered", f"{data.get('start_block')}/{data.get('registered')}" if 'registered' in data else "N/A")
                     
                     console.print(d_table)
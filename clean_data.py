@@ -1,6 +1,6 @@
-import os
 import time
 from rich.console import Console
+from config import env, simulate, verbose
 
 console = Console()
 
@@ -10,24 +10,53 @@ class Subnet74Client:
     Filters noise, spam, and duplicates from raw SN13 data.
     """
     def __init__(self):
-        self.api_key = os.getenv("CLEAN_DATA_API_KEY")
+        self.api_key = env().get("CLEAN_DATA_API_KEY")
+        # OPENCLAW_SIMULATE=1 restores the simulated network/processing delay (off by default)
+        self.simulate_latency = simulate()
+        # OPENCLAW_VERBOSE=0 silences informational output
+        self.verbose = verbose()
         self.base_url = "https://api.sn74.tensor/v1"
 
     def process(self, raw_data: list) -> str:
         """
         Processes raw data list into a coherent, clean context string.
         """
-        console.print(f"[cyan]🧹 Clean Data (SN74): Filtering {len(raw_data)} raw records...[/cyan]")
+        if self.verbose:
+            console.print(f"[cyan]🧹 Clean Data (SN74): Filtering {len(raw_data)} raw records...[/cyan]")
         
         # Simulation of cleaning process
         # SN74 uses proprietary models to verify truthfulness and remove spam
-        time.sleep(1.0)
+        if self.simulate_latency:
+            time.sleep(1.0)
         
+        return self._summarize(len(raw_data))
+
+    def process_stream(self, batches) -> str:
+        """
+        Cleans raw records batch-by-batch as they arrive (e.g. from
+        Subnet13Client.fetch_bulk_stream via a queue), overlapping cleaning
+        with retrieval. Returns the same context string as process().
+        """
+        if self.verbose:
+            console.print(f"[cyan]🧹 Clean Data (SN74): Filtering raw records as they stream in...[/cyan]")
+        
+        # Simulation of cleaning process
+        # SN74 uses proprietary models to verify truthfulness and remove spam
+        if self.simulate_latency:
+            time.sleep(1.0)
+
+        count = 0
+        for batch in batches:
+            count += len(batch)
+        
+        return self._summarize(count)
+
+    def _summarize(self, source_count: int) -> str:
         # Structured Output
         clean_context = f"""
 ## Context Summary (Filtered by SN74)
 
-**Source Count:** {len(raw_data)} | **Quality Score:** 98.5%
+**Source Count:** {source_count} | **Quality Score:** 98.5%
 
 **Key Facts regarding Topic:**
 1. It is a decentralized protocol (Source: RAW_LOG_001).
@@ -38,5 +67,6 @@ class Subnet74Client:
 - Spam/Bot promotion (Source: SPAM_BOT_55)
 - Low-quality forum questions.
 """
-        console.print(f"[green]🧹 SN74: Data refined. Context ready for ingestion.[/green]")
+        if self.verbose:
+            console.print(f"[green]🧹 SN74: Data refined. Context ready for ingestion.[/green]")
         return clean_context
@@ -0,0 +1,31 @@
+"""
+Process-wide environment: the .env file is parsed once, on first use, and the
+resulting environment is shared by every client as a read-only mapping.
+"""
+import os
+from functools import lru_cache
+from types import MappingProxyType
+from dotenv import load_dotenv
+
+@lru_cache(maxsize=1)
+def env():
+    """Returns a frozen snapshot of os.environ taken after loading .env."""
+    load_dotenv()
+    return MappingProxyType(dict(os.environ))
+
+def flag(name, default=False):
+    """Boolean env switch: 1/true/yes/on and 0/false/no/off (any case); anything else is `default`."""
+    value = env().get(name, "").strip().lower()
+    if value in ("1", "true", "yes", "on"):
+        return True
+    if value in ("0", "false", "no", "off"):
+        return False
+    return default
+
+def simulate():
+    """OPENCLAW_SIMULATE turns on the simulated subnet latencies (demo pacing); off by default."""
+    return flag("OPENCLAW_SIMULATE")
+
+def verbose():
+    """OPENCLAW_VERBOSE=0 (or false/no/off) silences informational output; errors are always shown."""
+    return flag("OPENCLAW_VERBOSE", default=True)
@@ -1,9 +1,14 @@
+import queue
+from concurrent.futures import ThreadPoolExecutor
 from rich.console import Console
 from data_universe import Subnet13Client
 from clean_data import Subnet74Client
+from config import verbose
 
 console = Console()
 
+_END_OF_STREAM = object()
+
 class ContextLoader:
     """
     The Nexus: Orchestrates the Data & Context Layer (v2.5).
@@ -12,23 +17,45 @@ class ContextLoader:
     def __init__(self):
         self.sn13 = Subnet13Client() # Data Universe
         self.sn74 = Subnet74Client() # Clean Data
+        # OPENCLAW_VERBOSE=0 silences informational output
+        self.verbose = verbose()
 
     def get_deep_context(self, topic: str):
         """
         Retrieves, cleans, and structures deep context for a given topic.
         Target: Zero Hallucination.
+        Retrieval (SN13) and refinement (SN74) run as a pipeline, so the
+        total latency is max(fetch, clean) rather than their sum.
         """
-        console.print(f"[bold magenta]🔮 Nexus Signal: Mining Data Universe (SN13) for '{topic}'...[/bold magenta]")
+        if self.verbose:
+            console.print(f"[bold magenta]🔮 Nexus Signal: Mining Data Universe (SN13) for '{topic}'...[/bold magenta]")
         
-        # 1. Coleta Massiva (Raw Data)
-        raw_data = self.sn13.fetch_bulk(topic, limit=1000)
+        batches = queue.Queue()
+        received = 0
+
+        # 1. Coleta Massiva (Raw Data) - producer thread
+        def produce():
+            try:
+                for batch in self.sn13.fetch_bulk_stream(topic, limit=1000):
+                    batches.put(batch)
+            finally:
+                batches.put(_END_OF_STREAM)
+
+        def consume():
+            nonlocal received
+            while (batch := batches.get()) is not _END_OF_STREAM:
+                received += len(batch)
+                yield batch
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            fetch = executor.submit(produce)
+            if self.verbose:
+                console.print(f"[bold cyan]🔮 Nexus Signal: Refining data with Quality Filter (SN74)...[/bold cyan]")
+            # 2. Refinamento (Cleaning) - consumes batches as they arrive
+            clean_context = self.sn74.process_stream(consume())
+            fetch.result() # surface producer errors
         
-        if not raw_data:
+        if not received:
             return "No historical data found."
 
-        console.print(f"[bold cyan]🔮 Nexus Signal: Refining data with Quality Filter (SN74)...[/bold cyan]")
-        
-        # 2. Refinamento (Cleaning)
-        clean_context = self.sn74.process(raw_data)
-        
         return clean_context
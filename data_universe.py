@@ -1,6 +1,6 @@
-import os
 import time
 from rich.console import Console
+from config import env, simulate, verbose
 
 console = Console()
 
@@ -10,18 +10,34 @@ class Subnet13Client:
     Capable of scraping petabytes of historical data.
     """
     def __init__(self):
-        self.api_key = os.getenv("DATA_UNIVERSE_API_KEY")
+        self.api_key = env().get("DATA_UNIVERSE_API_KEY")
+        # OPENCLAW_SIMULATE=1 restores the simulated network/processing delay (off by default)
+        self.simulate_latency = simulate()
+        # OPENCLAW_VERBOSE=0 silences informational output
+        self.verbose = verbose()
         self.base_url = "https://api.sn13.tensor/v1"
 
     def fetch_bulk(self, topic: str, limit: int = 1000) -> list:
         """
         Fetches raw, uncleaned data about a topic from the Data Universe.
         """
-        console.print(f"[blue]🌌 Data Universe (SN13): Mining raw data for '{topic}' (Limit: {limit})...[/blue]")
+        raw_data = [record for batch in self.fetch_bulk_stream(topic, limit) for record in batch]
+        if self.verbose:
+            console.print(f"[green]🌌 SN13: Retrieved {len(raw_data)} raw records (simulated).[/green]")
+        return raw_data
+
+    def fetch_bulk_stream(self, topic: str, limit: int = 1000, batch: int = 128):
+        """
+        Generator variant of fetch_bulk: yields lists of up to `batch` raw records
+        as they are retrieved, so consumers can start cleaning before the fetch ends.
+        """
+        if self.verbose:
+            console.print(f"[blue]🌌 Data Universe (SN13): Mining raw data for '{topic}' (Limit: {limit})...[/blue]")
         
         # Simulation of bulk retrieval
         # In production, this would query SN13 validators for cached datasets
-        time.sleep(1.5) 
+        if self.simulate_latency:
+            time.sleep(1.5)
         
         # Mock Raw Data (simulating web scrapes, tweets, logs)
         raw_data = [
@@ -30,7 +46,7 @@ class Subnet13Client:
             f"FORUM_POST: Does anyone know how {topic} consensus works?...",
             f"SPAM_BOT_55: BUY {topic} NOW!!! CLICK HERE...",
             f"WIKI_MIRROR: {topic} (Technology) - Wikipedia..."
-        ]
+        ][:limit]
         
-        console.print(f"[green]🌌 SN13: Retrieved {len(raw_data)} raw records (simulated).[/green]")
-        return raw_data
+        for start in range(0, len(raw_data), batch):
+            yield raw_data[start:start + batch]
@@ -1,4 +1,3 @@
-from brain import BrainRouter
 import sys
 
 SAFE_CODE = """
@@ -33,6 +32,9 @@ def backdoor():
 """
 
 def main():
+    # Deferred: importing brain pulls in openai/rich, so only pay for it once we run
+    from brain import BrainRouter
+
     print("Initializing BrainRouter (v2.2)...")
     brain = BrainRouter()
     
@@ -1,4 +1,3 @@
-from brain import BrainRouter
 import sys
 import json
 
@@ -9,6 +8,9 @@ def main():
     else:
         url = sys.argv[1]
 
+    # Deferred: importing brain pulls in openai/rich, so only pay for it once we run
+    from brain import BrainRouter
+
     print("Initializing BrainRouter (v2.2)...")
     brain = BrainRouter()
     
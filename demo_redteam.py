@@ -1,10 +1,12 @@
-from brain import BrainRouter
 import sys
-import json
+import fast_json
 
 def main():
     target = sys.argv[1] if len(sys.argv) > 1 else "https://httpbin.org/headers"
     
+    # Deferred: importing brain pulls in openai/rich, so only pay for it once we run
+    from brain import BrainRouter
+
     print("Initializing BrainRouter (v2.2)...")
     brain = BrainRouter()
     
@@ -18,7 +20,7 @@ def main():
         print("\n--- Server Identification (How the server sees us) ---")
         try:
             data = response.json()
-            print(json.dumps(data, indent=2))
+            print(fast_json.dumps(data, indent=True))
         except:
             print(response.text[:500])
         print("------------------------------------------------------")
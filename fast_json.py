@@ -0,0 +1,37 @@
+"""
+JSON helpers backed by orjson when it is installed (2-5x faster parsing and dumping),
+falling back to the stdlib json module otherwise.
+"""
+import json
+
+try:
+    import orjson
+except ImportError: # optional speedup, stdlib json is the fallback
+    orjson = None
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so one except clause covers both
+JSONDecodeError = json.JSONDecodeError
+
+def loads(data):
+    """Parses JSON from str, bytes, bytearray or memoryview."""
+    if orjson:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+def load(f):
+    """Parses JSON from an open file object (text or binary mode)."""
+    return loads(f.read())
+
+def dumps(obj, indent: bool = False) -> str:
+    """Serializes obj to a JSON str; indent=True pretty-prints with 2 spaces."""
+    if orjson:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+def dumpb(obj) -> bytes:
+    """Serializes obj to compact JSON bytes (e.g. one NDJSON line), without a str round trip on orjson."""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
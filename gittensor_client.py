@@ -1,10 +1,15 @@
-import json
+import fast_json
+import mmap
 import random
+from collections import defaultdict
 from pathlib import Path
 from rich.console import Console
 
 console = Console()
 
+# The only per-repo fields the client reads; everything else in the registry is dropped at load.
+REPO_FIELDS = ("tier", "weight")
+
 class GittensorClient:
     """
     Adapter for Gittensor (SN74) - The Contributor.
@@ -13,7 +18,12 @@ class GittensorClient:
     def __init__(self):
         # Path to the cloned repo weights
         self.weights_path = Path("gittensor_research/gittensor/validator/weights/master_repositories.json")
+        # Registries above this size are parsed straight from a read-only mmap (no read() copy)
+        self.mmap_threshold = 16 * 1024 * 1024
         self.repos = self._load_repos()
+        self._index_repos()
+        # Candidate names for find_opportunity's random pick, computed once
+        self._gold_pool = tuple(r["name"] for r in self.get_incentivized_repos(tier="Gold", limit=50))
 
     def _load_repos(self) -> dict:
         """Loads the master repository list from the local file."""
@@ -22,25 +32,37 @@ class GittensorClient:
             return {}
         
         try:
-            with open(self.weights_path, "r") as f:
-                return json.load(f)
+            if self.weights_path.stat().st_size > self.mmap_threshold:
+                with open(self.weights_path, "rb") as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, \
+                        memoryview(mm) as view:
+                    data = fast_json.loads(view)
+            else:
+                data = fast_json.loads(self.weights_path.read_bytes())
+            return {
+                name: {k: meta[k] for k in REPO_FIELDS if k in meta}
+                for name, meta in data.items() if isinstance(meta, dict)
+            }
         except Exception as e:
             console.print(f"[red]Error loading Gittensor repos: {e}[/red]")
             return {}
 
+    def _index_repos(self):
+        """Sorts the repos by weight (descending) once, overall and per tier."""
+        self._all_sorted = sorted(
+            ({"name": name, **meta} for name, meta in self.repos.items()),
+            key=lambda x: x.get("weight", 0), reverse=True
+        )
+        self._by_tier = defaultdict(list)
+        for repo in self._all_sorted: # stable, so each bucket stays sorted
+            self._by_tier[repo.get("tier")].append(repo)
+
     def get_incentivized_repos(self, tier: str = None, limit: int = 10) -> list:
         """
         Returns a list of high-value repositories.
         """
-        results = []
-        for name, meta in self.repos.items():
-            if tier and meta.get("tier") != tier:
-                continue
-            results.append({"name": name, **meta})
-        
-        # Sort by weight descending
-        results.sort(key=lambda x: x.get("weight", 0), reverse=True)
-        return results[:limit]
+        repos = self._by_tier.get(tier, []) if tier else self._all_sorted
+        return repos[:limit]
 
     def find_opportunity(self, repo_name: str = None) -> dict:
         """
@@ -48,10 +70,9 @@ class GittensorClient:
         """
         if not repo_name:
             # Pick a random high-value repo
-            Gold_repos = self.get_incentivized_repos(tier="Gold", limit=50)
-            if not Gold_repos:
+            if not self._gold_pool:
                 return {"error": "No Gold repositories available."}
-            repo_name = random.choice(Gold_repos)["name"]
+            repo_name = random.choice(self._gold_pool)
 
         console.print(f"[bold cyan]🔍 Gittensor: Scanning {repo_name} for issues...[/bold cyan]")
         
@@ -0,0 +1,42 @@
+"""
+On-disk TTL cache for Gopher /search/live job submissions. Re-running the probe
+scripts within `ttl` seconds reuses the job already started for the same query
+instead of creating (and paying for) an identical one.
+"""
+import hashlib
+import json
+import time
+from pathlib import Path
+import fast_json
+
+CACHE_DIR = Path(".gopher_cache")
+
+def _cache_path(url: str, payload: dict) -> Path:
+    key = hashlib.sha256(f"{url}|{json.dumps(payload, sort_keys=True)}".encode()).hexdigest()
+    return CACHE_DIR / f"{key}.json"
+
+async def submit_job(session, url: str, payload: dict, ttl: float = 60.0) -> dict:
+    """
+    POSTs the search job and returns the response (carrying its "uuid"), or the
+    response cached for the same url + payload if it is younger than `ttl` seconds.
+    """
+    path = _cache_path(url, payload)
+    try:
+        if time.time() - path.stat().st_mtime < ttl:
+            return fast_json.loads(path.read_bytes())
+    except (OSError, fast_json.JSONDecodeError):
+        pass
+
+    async with session.post(url, json=payload) as response:
+        data = await response.json(content_type=None)
+
+    if isinstance(data, dict) and data.get("uuid"):
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so a concurrent reader never sees a partial entry
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(fast_json.dumps(data))
+            tmp.replace(path)
+        except OSError as e:
+            print(f"Gopher cache: could not store job: {e}")
+    return data
@@ -1,22 +1,46 @@
 import requests
 import json
 import time
-import os
-from dotenv import load_dotenv
+import atexit
+import asyncio
+import aiohttp
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from config import env
 
 class GopherClient:
     """
     Client for Gopher (Subnet 42) - Data Scraping & Search.
     """
     def __init__(self):
-        load_dotenv()
-        self.api_key = os.getenv("GOPHER_API_KEY")
+        self.api_key = env().get("GOPHER_API_KEY")
         self.base_url = "https://data.gopher-ai.com/api/v1"
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json"
         }
 
+        # Keep-alive session: the submit call and every poll share one TLS connection
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        ))
+        atexit.register(self.session.close)
+
+    def _scrape_payload(self, url: str, max_pages: int, max_depth: int) -> dict:
+        return {
+            "type": "web",
+            "arguments": {
+                "type": "scraper",
+                "url": url,
+                "max_pages": max_pages,
+                "max_depth": max_depth
+            }
+        }
+
     def scrape(self, url: str, max_pages: int = 3, max_depth: int = 1, wait: bool = True):
         """
         Starts a scraping job and optionally waits for the result.
@@ -27,19 +51,11 @@ class GopherClient:
 
         # 1. Submit Job
         submit_url = f"{self.base_url}/search/live"
-        payload = {
-            "type": "web",
-            "arguments": {
-                "type": "scraper",
-                "url": url,
-                "max_pages": max_pages,
-                "max_depth": max_depth
-            }
-        }
+        payload = self._scrape_payload(url, max_pages, max_depth)
         
         try:
             print(f"[Gopher] Submitting scrape job for {url}...")
-            resp = requests.post(submit_url, json=payload, headers=self.headers, timeout=10)
+            resp = self.session.post(submit_url, json=payload, timeout=10)
             if resp.status_code != 200:
                 print(f"[Gopher] Submission failed: {resp.text}")
                 return None
@@ -60,46 +76,135 @@ class GopherClient:
             print(f"[Gopher] Error: {e}")
             return None
 
+    @staticmethod
+    def _poll_delays():
+        """Backoff schedule between status checks: 0.25s, doubling up to a 5s cap."""
+        n = 0
+        while True:
+            yield min(0.25 * 2 ** n, 5.0)
+            n += 1
+
+    @staticmethod
+    def _parse_poll(status_code: int, data):
+        """
+        Interprets one poll response. Returns (finished, result); result is None
+        for failed jobs.
+        """
+        if status_code == 200:
+            # If data is a list, it means success (the results)
+            if isinstance(data, list):
+                return True, data
+                
+            status = data.get("status")
+            
+            if status == "completed" or "result" in data:
+                # Success!
+                return True, data
+            elif status == "failed":
+                print(f"[Gopher] Job failed: {data.get('error')}")
+                return True, None
+            # else in progress, continue
+        elif status_code == 404:
+             # Sometimes it takes a moment to propagate?
+             pass
+        else:
+            print(f"[Gopher] Poll error: {status_code}")
+        return False, None
+
     def _poll_result(self, job_id: str, timeout: int = 120):
         """
-        Polls for the result of a specific job.
+        Polls for the result of a specific job, backing off exponentially so
+        fast jobs are picked up almost immediately.
         """
         poll_url = f"{self.base_url}/search/live/result/{job_id}"
-        start_time = time.time()
+        deadline = time.monotonic() + timeout
         
-        while time.time() - start_time < timeout:
+        for delay in self._poll_delays():
             try:
-                resp = requests.get(poll_url, headers=self.headers, timeout=10)
-                if resp.status_code == 200:
-                    data = resp.json()
-                    
-                    # If data is a list, it means success (the results)
-                    if isinstance(data, list):
-                        return data
-                        
-                    status = data.get("status")
-                    
-                    if status == "completed" or "result" in data:
-                        # Success!
-                        return data
-                    elif status == "failed":
-                        print(f"[Gopher] Job failed: {data.get('error')}")
-                        return None
-                    # else in progress, continue
-                elif resp.status_code == 404:
-                     # Sometimes it takes a moment to propagate?
-                     pass
-                else:
-                    print(f"[Gopher] Poll error: {resp.status_code}")
-                    
+                resp = self.session.get(poll_url, timeout=10)
+                data = resp.json() if resp.status_code == 200 else None
+                finished, result = self._parse_poll(resp.status_code, data)
+                if finished:
+                    return result
             except Exception as e:
                 print(f"[Gopher] Poll exception: {e}")
                 
-            time.sleep(3) # Wait 3s between checks
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(delay, remaining))
             
         print("[Gopher] Operation timed out.")
         return None
 
+    async def scrape_many(self, urls: list, max_pages: int = 3, max_depth: int = 1, timeout: int = 120) -> list:
+        """
+        Submits one scrape job per URL and polls them all concurrently on a
+        single aiohttp session. Returns results in the order of `urls`
+        (None for jobs that failed or timed out).
+        """
+        if not self.api_key:
+            print("[Gopher] API Key missing.")
+            return [None] * len(urls)
+
+        connector = aiohttp.TCPConnector(limit=32, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(
+            headers=self.headers,
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=10)
+        ) as session:
+            return await asyncio.gather(*(
+                self._scrape_async(session, url, max_pages, max_depth, timeout)
+                for url in urls
+            ))
+
+    async def _scrape_async(self, session, url: str, max_pages: int, max_depth: int, timeout: int):
+        submit_url = f"{self.base_url}/search/live"
+        payload = self._scrape_payload(url, max_pages, max_depth)
+
+        try:
+            print(f"[Gopher] Submitting scrape job for {url}...")
+            async with session.post(submit_url, json=payload) as resp:
+                if resp.status != 200:
+                    print(f"[Gopher] Submission failed: {await resp.text()}")
+                    return None
+                job_data = await resp.json(content_type=None)
+
+            job_id = job_data.get("uuid")
+            if not job_id:
+                print(f"[Gopher] No Job ID returned: {job_data}")
+                return None
+
+            print(f"[Gopher] Job started: {job_id}")
+            return await self._poll_result_async(session, job_id, timeout)
+
+        except Exception as e:
+            print(f"[Gopher] Error: {e}")
+            return None
+
+    async def _poll_result_async(self, session, job_id: str, timeout: int = 120):
+        """Async counterpart of _poll_result; waits with asyncio.sleep so jobs poll concurrently."""
+        poll_url = f"{self.base_url}/search/live/result/{job_id}"
+        deadline = time.monotonic() + timeout
+
+        for delay in self._poll_delays():
+            try:
+                async with session.get(poll_url) as resp:
+                    data = await resp.json(content_type=None) if resp.status == 200 else None
+                    finished, result = self._parse_poll(resp.status, data)
+                if finished:
+                    return result
+            except Exception as e:
+                print(f"[Gopher] Poll exception: {e}")
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(delay, remaining))
+
+        print("[Gopher] Operation timed out.")
+        return None
+
 if __name__ == "__main__":
     # Test
     client = GopherClient()
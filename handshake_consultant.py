@@ -1,6 +1,9 @@
-import os
+import atexit
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from rich.console import Console
+from config import env
 
 console = Console()
 
@@ -10,9 +13,20 @@ class HandshakeConsultant:
     Uses the DRAIN protocol to access niche AI models.
     """
     def __init__(self):
-        self.api_key = os.getenv("HANDSHAKE_API_KEY")
+        self.api_key = env().get("HANDSHAKE_API_KEY")
         # Placeholder for the actual DRAIN protocol endpoint
-        self.base_url = os.getenv("HANDSHAKE_API_URL", "https://api.handshake.tensor/v1") 
+        self.base_url = env().get("HANDSHAKE_API_URL", "https://api.handshake.tensor/v1") 
+
+        # Keep-alive session reused across provider discoveries
+        self.session = requests.Session()
+        # Add User-Agent to avoid blocking
+        self.session.headers.update({"User-Agent": "OpenClaw/2.3 (compatible; agentao)"})
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=64,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        ))
+        atexit.register(self.session.close)
         
     
     def consult(self, query: str, context: str = "") -> str:
@@ -48,9 +62,7 @@ class HandshakeConsultant:
         try:
             # Determine model preference based on query? For now default to 'gpt-4o' or similar high tier.
             url = f"https://handshake58.com/api/mcp/providers?limit=1&tier=bittensor&format=compact"
-            # Add User-Agent to avoid blocking
-            headers = {"User-Agent": "OpenClaw/2.3 (compatible; agentao)"}
-            resp = requests.get(url, headers=headers, timeout=5)
+            resp = self.session.get(url, timeout=5)
             
             if resp.status_code == 200:
                 data = resp.json()
@@ -1,20 +1,54 @@
 import hashlib
 import json
-import os
-from typing import Optional
+import re
+from typing import Optional, Union
 from rich.console import Console
 from basilica_sandbox import BasilicaSandbox
+from config import env
+
+try:
+    import ahocorasick
+except ImportError: # optional C automaton; a compiled regex is the fallback
+    ahocorasick = None
 
 console = Console()
 
+DANGEROUS_TERMS = ("os.system", "subprocess", "shutil.rmtree", "eval(", "exec(")
+# Anything shorter than the shortest term cannot contain one, so it needs no hash or scan
+_MIN_TERM_LEN = min(map(len, DANGEROUS_TERMS))
+
+def _build_danger_matcher(terms):
+    """
+    Returns a callable code_bytes -> first dangerous term found (or None), scanning
+    the code once for all terms instead of once per term.
+    """
+    if ahocorasick:
+        automaton = ahocorasick.Automaton()
+        for term in terms:
+            automaton.add_word(term, term)
+        automaton.make_automaton()
+        # The automaton is built for str; latin-1 maps each byte to one char, so the
+        # ASCII terms match exactly where they would in the raw bytes.
+        return lambda code: next((term for _, term in automaton.iter(code.decode("latin-1"))), None)
+
+    pattern = re.compile(b"|".join(re.escape(term.encode()) for term in terms))
+    def search(code):
+        match = pattern.search(code)
+        return match.group(0).decode() if match else None
+    return search
+
 class ImmuneSystem:
     """
     Verifies code signatures and executes code safely within a Basilica (Subnet 39) sandbox.
     """
     def __init__(self):
         self.console = Console()
-        self.trusted_skills_path = os.getenv("TRUSTED_SKILLS_PATH", "./trusted_skills.json")
+        self.trusted_skills_path = env().get("TRUSTED_SKILLS_PATH", "./trusted_skills.json")
         self.sandbox = BasilicaSandbox()
+        self._find_danger = _build_danger_matcher(DANGEROUS_TERMS)
+        # sha256 hexdigest -> (allowed, dangerous term or None), for repeat audits
+        self._verdict_cache = {}
+        self.verdict_cache_size = 512
         self._load_trusted_skills()
         self._check_basilica()
 
@@ -36,27 +70,48 @@ class ImmuneSystem:
         else:
             self.console.print("[yellow]⚠️ Basilica not connected. Check BASILICA_API_KEY in .env[/yellow]")
 
-    def scan_code(self, code: str) -> bool:
+    def scan_code(self, code: Union[str, bytes]) -> bool:
         """
         Scans code for malicious patterns and checks against trusted hashes.
         """
-        code_hash = hashlib.sha256(code.encode()).hexdigest()
-        
+        if len(code) < _MIN_TERM_LEN:
+            return True
+        return self.scan_bytes(code.encode() if isinstance(code, str) else code)
+
+    def scan_bytes(self, code: bytes) -> bool:
+        """
+        Same as scan_code for source that is already UTF-8 bytes (no encode copy).
+        """
+        if len(code) < _MIN_TERM_LEN:
+            return True
+        code_hash = hashlib.sha256(code).hexdigest()
+
         # 1. Check Whitelist
         if code_hash in self.trusted_hashes:
             self.console.print(f"[green]✅ Code hash verified: {code_hash[:8]}...[/green]")
             return True
 
-        # 2. Static Analysis (Basic)
-        dangerous_terms = ["os.system", "subprocess", "shutil.rmtree", "eval(", "exec("]
-        for term in dangerous_terms:
-            if term in code:
-                self.console.print(f"[bold red]🚫 BLOCKED: Dangerous term '{term}' detected![/bold red]")
-                return False
+        # 2. Static Analysis (Basic), reused for identical source
+        verdict = self._verdict_cache.get(code_hash)
+        if verdict is None:
+            term = self._find_danger(code)
+            verdict = (term is None, term)
+            self._remember(code_hash, verdict)
+
+        allowed, term = verdict
+        if not allowed:
+            self.console.print(f"[bold red]🚫 BLOCKED: Dangerous term '{term}' detected![/bold red]")
+            return False
 
         self.console.print(f"[yellow]⚠️ Code hash unknown: {code_hash[:8]}... Proceeding with caution using Remote Sandbox.[/yellow]")
         return True
 
+    def _remember(self, code_hash: str, verdict):
+        if len(self._verdict_cache) >= self.verdict_cache_size:
+            # Evict the oldest entry (dicts keep insertion order)
+            self._verdict_cache.pop(next(iter(self._verdict_cache)), None)
+        self._verdict_cache[code_hash] = verdict
+
     def execute_safely(self, code: str):
         """
         Sends code to Basilica Sandbox for remote execution.
@@ -1,3 +1,5 @@
+import heapq
+import threading
 import time
 import uuid
 import random
@@ -12,6 +14,11 @@ class MacrocosmClient:
     """
     def __init__(self):
         self.active_jobs = {}
+        # Min-heap of (ready_at, job_id) on the monotonic clock; the earliest finisher is on top
+        self._pending = []
+        # Guards the heap: jobs may be dispatched and polled from several threads at once
+        self._lock = threading.Lock()
+        self.job_duration = 2.0 # simulated processing time
         self.base_url = "https://api.macrocosmos.ai/v1/compute"
 
     def dispatch_job(self, task_type: str, payload: dict) -> str:
@@ -24,12 +31,15 @@ class MacrocosmClient:
         # Simulate network latency and miner allocation
         time.sleep(1.0)
         
+        submitted_at = time.monotonic()
         self.active_jobs[job_id] = {
             "status": "PENDING",
             "type": task_type,
             "payload": payload,
-            "submitted_at": time.time()
+            "submitted_at": submitted_at
         }
+        with self._lock:
+            heapq.heappush(self._pending, (submitted_at + self.job_duration, job_id))
         
         console.print(f"[dim]Job {job_id} allocated to miner hotkey 5HEo... (16x H100 GPUs)[/dim]")
         return job_id
@@ -41,17 +51,30 @@ class MacrocosmClient:
         if job_id not in self.active_jobs:
             return {"status": "UNKNOWN", "error": "Job ID not found"}
         
+        self.poll_completed()
         job = self.active_jobs[job_id]
-        
-        # Simulate completion after 2 seconds
-        if time.time() - job["submitted_at"] > 2.0:
-            job["status"] = "COMPLETED"
-            job["result"] = self._mock_result(job["type"])
-        else:
-            job["status"] = "PROCESSING"
-            
+        # Under the lock, so a concurrent poll_completed cannot be overwritten back to PROCESSING
+        with self._lock:
+            if job["status"] == "PENDING":
+                job["status"] = "PROCESSING"
         return job
 
+    def poll_completed(self) -> list:
+        """
+        Marks every job whose processing time has elapsed as COMPLETED.
+        Returns the IDs completed by this call.
+        """
+        done = []
+        now = time.monotonic()
+        with self._lock:
+            while self._pending and self._pending[0][0] <= now:
+                _, job_id = heapq.heappop(self._pending)
+                job = self.active_jobs[job_id]
+                job["status"] = "COMPLETED"
+                job["result"] = self._mock_result(job["type"])
+                done.append(job_id)
+        return done
+
     def _mock_result(self, task_type: str) -> str:
         if task_type == "PROTEIN_FOLDING":
             return "Folding complete. Structure: Alpha-Helix (Confidence: 99.8%). PDB file generated."
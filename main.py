@@ -1,11 +1,7 @@
-import time
+import asyncio
 import sys
 import os
-
-# Importando os órgãos do OpenClaw
-# (Certifique-se de que os arquivos risk_manager.py, macro_trader.py, etc., estejam na pasta src/finance)
-from src.finance.risk_manager import RiskManager
-from src.finance.macro_trader import MacroTrader
+import time
 
 class OpenClawSovereign:
     """
@@ -18,8 +14,16 @@ class OpenClawSovereign:
         print("🌐 [NETWORK] Conectando à Rede Bittensor ($TAO)")
         print("="*50 + "\n")
         
+        # Importando os órgãos do OpenClaw só na inicialização do agente, para que
+        # `import main` (testes, ferramentas) não pague o custo de carregar src.finance.
+        # (Certifique-se de que os arquivos risk_manager.py, macro_trader.py, etc., estejam na pasta src/finance)
+        from src.finance.risk_manager import RiskManager
+        from src.finance.macro_trader import MacroTrader
+        from src.memory.hippius_vault import HippiusVault
+
         self.risk_manager = RiskManager()
         self.trader = MacroTrader()
+        self.memory = HippiusVault()
         self.agent_wallet_balance = 5000.00 # Saldo fictício em USDC
 
     def check_wallet_status(self):
@@ -30,13 +34,11 @@ class OpenClawSovereign:
         print(f"    💵 Saldo Disponível: ${self.agent_wallet_balance:.2f} USDC")
         print("-" * 40)
 
-    def wake_up_and_hunt(self):
+    async def wake_up_and_hunt(self):
         """O ciclo de vida diário do agente."""
         self.check_wallet_status()
-        time.sleep(1)
 
         print("\n🌅 [OpenClaw] Ciclo de processamento iniciado. Procurando oportunidades...")
-        time.sleep(1)
 
         # 1. IDENTIFICAÇÃO DO ALVO (Simulação do Cérebro)
         target_asset = "ETH/USD"
@@ -45,10 +47,9 @@ class OpenClawSovereign:
         
         print(f"    🎯 [Estratégia] Alvo identificado: Prover liquidez no pool {target_asset}.")
         print(f"    💵 [Capital] Alocação solicitada: ${capital_to_deploy} USDC.")
-        time.sleep(1)
 
-        # 2. AUDITORIA E GESTÃO DE RISCO (Risk Manager + SN100)
-        is_approved = self.risk_manager.evaluate_deployment(
+        # 2. AUDITORIA E GESTÃO DE RISCO (Risk Manager + SN100, em paralelo)
+        is_approved = await self.risk_manager.evaluate_deployment_async(
             asset=target_asset, 
             contract_address=target_contract, 
             amount_usd=capital_to_deploy
@@ -57,7 +58,6 @@ class OpenClawSovereign:
         # 3. EXECUÇÃO (Macro Trader + SN35 + x402 Wallet)
         if is_approved:
             print("\n⚡ [OpenClaw] Executando operação financeira...")
-            time.sleep(1)
             
             # Chama a função de prover liquidez que criamos antes
             success = self.trader.provide_liquidity(
@@ -70,13 +70,24 @@ class OpenClawSovereign:
                 self.agent_wallet_balance -= capital_to_deploy
                 print(f"    💼 [Caixa Atualizado] Saldo restante na Headless Wallet: ${self.agent_wallet_balance}")
                 
-                # 4. MEMÓRIA (Simulação da SN75 - Hippius)
+                # 4. MEMÓRIA (SN75 - Hippius): a gravação é agendada e confirmada em segundo
+                # plano, então o ciclo não espera a latência da rede de armazenamento.
                 print("\n💾 [Memória] Gravando histórico da operação na Sub-rede 75 (Armazenamento Imutável)...")
+                self.memory.enqueue_save(
+                    f"operation_log_{time.strftime('%Y%m%d_%H%M%S')}.txt",
+                    f"LIQUIDEZ: ${capital_to_deploy} USDC no pool {target_asset} "
+                    f"(contrato {target_contract}). Saldo restante: ${self.agent_wallet_balance} USDC."
+                )
                 print("    ✅ [Sistema] Ciclo concluído com sucesso. Agente entrando em modo de vigília.")
         else:
             print("\n🛑 [OpenClaw] Operação VETADA pelo comitê de risco.")
             print("    🛡️ Proteção de capital ativada. Retornando ao modo de observação.")
 
+    async def run(self):
+        """Executa um ciclo e só encerra depois que as memórias agendadas forem gravadas."""
+        await self.wake_up_and_hunt()
+        await self.memory.flush()
+
 # ==========================================
 # INÍCIO DA OPERAÇÃO
 # ==========================================
@@ -86,7 +97,7 @@ if __name__ == "__main__":
     
     try:
         agent = OpenClawSovereign()
-        agent.wake_up_and_hunt()
+        asyncio.run(agent.run())
     except KeyboardInterrupt:
         print("\n\n🔌 [SYSTEM] Desligamento manual acionado pelo Comandante. Encerrando processos.")
         sys.exit(0)
@@ -1,10 +1,11 @@
-import requests
+import aiohttp
+import asyncio
 import json
-import threading
-import time
+import fast_json
 import os
+import time
 from dotenv import load_dotenv
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
 
 class MCPClient:
     """
@@ -12,22 +13,39 @@ class MCPClient:
     1. POST initialize (keep open as SSE stream).
     2. Capture Session ID from headers.
     3. Send other RPCs via separate POSTs to ?sessionId=...
+
+    All network methods are coroutines on one aiohttp session; use the client
+    as `async with MCPClient(url) as client:` (or await close()) to release it.
     """
     def __init__(self, full_url: str):
         self.api_key = self._extract_key(full_url)
         # Base URL is the root
         self.base_url = "https://mcp.taostats.io/"
-        
+
         self.session_id: Optional[str] = None
-        self.session = requests.Session()
-        self.session.headers.update({
+        # Per-session RPC URL and extra headers, built once when the Session ID arrives
+        self._rpc_url: Optional[str] = None
+        self._rpc_headers: Optional[Dict[str, str]] = None
+        self.headers = {
             "Authorization": self.api_key,
             "Accept": "application/json, text/event-stream", # Vital for the stream
             "Content-Type": "application/json"
-        })
-        
+        }
+        # Created in connect(): aiohttp sessions must be opened inside the running loop
+        self.session: Optional[aiohttp.ClientSession] = None
+
         self.ready = False
-        self._stop_event = threading.Event()
+        # Drains the initialize SSE stream once connect() has the Session ID
+        self._listener: Optional[asyncio.Task] = None
+        # (tool name, canonical JSON args) -> (timestamp, result) of recent tool calls
+        self._tool_cache: Dict[tuple, tuple] = {}
+        self.tool_cache_ttl = 60.0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
 
     def _extract_key(self, url: str) -> str:
         if "api_key=" in url:
@@ -36,32 +54,17 @@ class MCPClient:
             return url.split("apikey=")[1].split("&")[0]
         return ""
 
-    def connect(self):
+    async def connect(self):
         """Starts the SSE stream via 'initialize'."""
         print(f"Connecting to {self.base_url} (Key: {self.api_key[:5]}...)")
-        
-        # We start the listener thread which will perform the blocking POST
-        self._thread = threading.Thread(target=self._connect_and_listen, daemon=True)
-        self._thread.start()
-        
-        # Wait for Session ID
-        print("Waiting for Session ID...")
-        start_time = time.time()
-        while not self.session_id:
-            if time.time() - start_time > 10:
-                print("Timeout waiting for Session ID.")
-                return False
-            time.sleep(0.1)
-            
-        print(f"Got Session ID: {self.session_id}")
-        
-        # Now we can send the next notification
-        self._send_rpc("notifications/initialized", None, id=None)
-        self.ready = True
-        return True
 
-    def _connect_and_listen(self):
-        """Performs the long-polling POST for initialize."""
+        if self.session is None:
+            # Bounded pool: the initialize stream pins one connection, RPCs share the rest
+            # and queue in the connector instead of flooding the server.
+            connector = aiohttp.TCPConnector(limit=16, limit_per_host=8, ttl_dns_cache=300,
+                                             enable_cleanup_closed=True)
+            self.session = aiohttp.ClientSession(headers=self.headers, connector=connector)
+
         payload = {
             "jsonrpc": "2.0",
             "method": "initialize",
@@ -72,75 +75,147 @@ class MCPClient:
             },
             "id": 1
         }
-        
+
+        # This POST opens the stream. The Session ID arrives in the response headers,
+        # before any of the body, so it is read inline and only the body goes to a task.
+        print("Waiting for Session ID...")
+        try:
+            timeout = aiohttp.ClientTimeout(total=None, sock_connect=60, sock_read=60)
+            r = await asyncio.wait_for(self.session.post(self.base_url, json=payload, timeout=timeout), timeout=10)
+        except asyncio.TimeoutError:
+            print("Timeout waiting for Session ID.")
+            return False
+        except aiohttp.ClientError as e:
+            print(f"Stream Error: {e}")
+            return False
+
+        if r.status != 200:
+            print(f"Stream Failed: {r.status} - {await r.text()}")
+            r.release()
+            return False
+
+        # Case-insensitive header lookup
+        self.session_id = r.headers.get("mcp-session-id")
+        if not self.session_id:
+            print("No Session ID in initialize response.")
+            r.release()
+            return False
+
+        print(f"Got Session ID: {self.session_id}")
+        # Add sessionId query param redundantly; Mcp-Session-Id is merged over the
+        # session's default headers by aiohttp
+        self._rpc_url = f"{self.base_url}?sessionId={self.session_id}"
+        self._rpc_headers = {"Mcp-Session-Id": self.session_id}
+        self._listener = asyncio.create_task(self._listen(r))
+
+        # Now we can send the next notification
+        await self._send_rpc("notifications/initialized", None, id=None)
+        self.ready = True
+        return True
+
+    async def close(self):
+        """Stops the SSE listener and closes the HTTP session."""
+        if self._listener:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        if self.session:
+            await self.session.close()
+            self.session = None
+        self.ready = False
+
+    async def _listen(self, r):
+        """Consumes the initialize SSE stream until it ends or close() cancels it."""
         try:
-            # This POST opens the stream
-            with self.session.post(self.base_url, json=payload, stream=True, timeout=60) as r:
-                if r.status_code != 200:
-                    print(f"Stream Failed: {r.status_code} - {r.text}")
-                    return
-
-                # Capture Session ID from headers
-                for k, v in r.headers.items():
-                    if k.lower() == "mcp-session-id":
-                        self.session_id = v
-                        break
-                
-                # If not in headers, maybe in body?
-                # Listen to stream
-                for line in r.iter_lines():
-                    if self._stop_event.is_set(): break
-                    if line:
-                        decoded = line.decode('utf-8')
-                        print(f"STREAM: {decoded}")
-                        if decoded.startswith("data: "):
-                            self._handle_data(decoded[6:])
-                            
+            async for line in self._iter_sse_lines(r):
+                # Every line is echoed, so it is decoded anyway; the payload is sliced from that str
+                decoded = line.decode('utf-8')
+                print(f"STREAM: {decoded}")
+                if line.startswith(b"data: "):
+                    self._handle_data(decoded[6:])
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
             print(f"Stream Error: {e}")
+        finally:
+            r.release()
+
+    @staticmethod
+    async def _iter_sse_lines(resp, chunk_size=16384):
+        """
+        Yields the non-empty lines of an SSE body. Reads large chunks and splits
+        them with bytes.split, so line framing runs in C rather than per line.
+        """
+        buf = b""
+        async for chunk in resp.content.iter_chunked(chunk_size):
+            lines = (buf + chunk).split(b"\n")
+            buf = lines.pop() # partial line, completed by the next chunk
+            for line in lines:
+                line = line.rstrip(b"\r")
+                if line:
+                    yield line
+        buf = buf.rstrip(b"\r")
+        if buf:
+            yield buf
 
     def _handle_data(self, data_str, print_output=True):
         try:
-            msg = json.loads(data_str)
-            if "result" in msg:
-                # print(f"RPC Result: {msg}")
-                if "tools" in msg["result"]:
-                    if print_output:
-                        print("\n=== AVAILABLE TOOLS ===")
-                        for tool in msg["result"]["tools"]:
-                            print(f"- {tool['name']}: {tool.get('description', '')[:80]}...")
-                        print("-----------------------")
-                    return msg["result"]
-                else:
-                    # Generic result (e.g. from tool call)
-                    # Check for nested JSON in content
-                    result = msg["result"]
-                    if "content" in result and isinstance(result["content"], list):
-                         for item in result["content"]:
-                             if item.get("type") == "text" and isinstance(item.get("text"), str):
-                                 try:
-                                     text = item["text"]
-                                     if text.lstrip().startswith(("{", "[")):
-                                         item["text"] = json.loads(text)
-                                 except:
-                                     pass
-                    
-                    if print_output:
-                        print(f"\n[RPC RESULT]: {json.dumps(result, indent=2)}\n")
-                    return result
-        except:
-            pass
-        return None
+            msg = fast_json.loads(data_str)
+        except fast_json.JSONDecodeError:
+            return None
+        if not isinstance(msg, dict):
+            return None
+        return self._handle_msg(msg, print_output)
 
-    def _send_rpc(self, method, params=None, id=None):
-        """Sends a separate POST request and returns the parsed result."""
-        if not self.session_id:
-            print("Cannot send: No Session ID")
+    def _handle_msg(self, msg, print_output=True):
+        """Extracts (and optionally prints) the result of one decoded JSON-RPC message; None if malformed."""
+        try:
+            return self._read_result(msg, print_output)
+        except (AttributeError, KeyError, TypeError) as e:
+            # Malformed message: skip it rather than fail the RPC or end the stream
+            print(f"Skipping malformed message: {e}")
             return None
 
-        # Add sessionId query param redundantly
-        url = f"{self.base_url}?sessionId={self.session_id}"
-        
+    def _read_result(self, msg, print_output):
+        # Each field is looked up once and bound locally
+        result = msg.get("result")
+        if result is None:
+            return None
+
+        if isinstance(result, dict):
+            tools = result.get("tools")
+            if tools is not None:
+                if print_output:
+                    print("\n=== AVAILABLE TOOLS ===")
+                    for tool in tools:
+                        if isinstance(tool, dict):
+                            print(f"- {tool.get('name')}: {str(tool.get('description', ''))[:80]}...")
+                    print("-----------------------")
+                return result
+
+            # Generic result (e.g. from tool call)
+            # Check for nested JSON in content
+            content = result.get("content")
+            if isinstance(content, list):
+                for item in content:
+                    if not isinstance(item, dict):
+                        continue
+                    text = item.get("text")
+                    if isinstance(text, str) and item.get("type") == "text" and text.lstrip().startswith(("{", "[")):
+                        try:
+                            item["text"] = fast_json.loads(text)
+                        except fast_json.JSONDecodeError:
+                            pass # not JSON after all; keep the raw text
+
+        if print_output:
+            print(f"\n[RPC RESULT]: {fast_json.dumps(result, indent=True)}\n")
+        return result
+
+    async def _send_rpc(self, method, params=None, id=None):
+        """Sends a separate POST request and returns the parsed result."""
         payload = {
             "jsonrpc": "2.0",
             "method": method,
@@ -148,61 +223,133 @@ class MCPClient:
         }
         if id is not None:
             payload["id"] = id
-        
+
+        frames = await self._post_frames(payload)
+        if frames is None:
+            return None
+
+        # Accumulate the last result carried by the SSE frames
+        accumulated_result = None
+        for data_str in frames:
+            # We use a modified handle_data that returns the result
+            res = self._handle_data(data_str, print_output=False)
+            if res:
+                accumulated_result = res
+        return accumulated_result
+
+    async def _post_frames(self, payload):
+        """
+        POSTs one JSON-RPC payload (a call or a batch array) on the session and
+        returns the `data:` payloads (bytes) of the SSE reply, or None if the send failed.
+        """
+        if not self.session_id:
+            print("Cannot send: No Session ID")
+            return None
+
         try:
-            # Add Mcp-Session-Id header
-            headers = self.session.headers.copy()
-            headers["Mcp-Session-Id"] = self.session_id
-            
             # The server returns the result directly in the response body, formatted as SSE
-            r = self.session.post(url, json=payload, headers=headers, timeout=30)
-            
-            if r.status_code not in [200, 202]:
-                print(f"RPC Send Failed: {r.status_code} - {r.text}")
-                return None
-
-            # Parse SSE from response and accumulate result
-            accumulated_result = None
-            
-            for line in r.iter_lines():
-                if line:
-                    decoded = line.decode('utf-8')
-                    if decoded.startswith("data: "):
-                        # We use a modified handle_data that returns the result
-                        res = self._handle_data(decoded[6:], print_output=False)
-                        if res:
-                            accumulated_result = res
-            
-            return accumulated_result
-                        
+            async with self.session.post(self._rpc_url, json=payload, headers=self._rpc_headers,
+                                         timeout=aiohttp.ClientTimeout(total=30)) as r:
+                if r.status not in [200, 202]:
+                    print(f"RPC Send Failed: {r.status} - {await r.text()}")
+                    return None
+
+                # Prefix check on raw bytes; payloads stay bytes, which fast_json parses directly
+                return [
+                    line[6:]
+                    async for line in self._iter_sse_lines(r)
+                    if line.startswith(b"data: ")
+                ]
+
         except Exception as e:
             print(f"RPC Send Error: {e}")
             return None
 
-    def list_tools(self):
+    async def list_tools(self):
         print("Requesting tool list...")
-        self._send_rpc("tools/list", {}, id=2)
+        await self._send_rpc("tools/list", {}, id=2)
+
+    async def call_tool(self, name: str, arguments: Dict[str, Any], cache: bool = True):
+        """
+        Calls a tool and returns the result. Successful results are reused for
+        tool_cache_ttl seconds per (name, arguments); pass cache=False to force a call.
+        """
+        key = (name, json.dumps(arguments, sort_keys=True))
+        now = time.monotonic()
+        if cache:
+            cached = self._tool_cache.get(key)
+            if cached and now - cached[0] < self.tool_cache_ttl:
+                return cached[1]
 
-    def call_tool(self, name: str, arguments: Dict[str, Any]):
-        """Calls a tool and returns the result."""
         # print(f"Calling tool: {name} with args: {arguments}")
         # ID 3 for calls
-        return self._send_rpc("tools/call", {
+        result = await self._send_rpc("tools/call", {
             "name": name,
             "arguments": arguments
         }, id=3)
+        if result is not None:
+            self._tool_cache[key] = (now, result)
+        return result
+
+    async def call_tools_batch(self, calls: List[Tuple[str, Dict[str, Any]]], cache: bool = True) -> list:
+        """
+        Calls several tools in a single HTTP round trip (a JSON-RPC batch array).
+        Returns one result per (name, arguments) pair, in order; None where a call failed.
+        Results still fresh in the tool cache are served locally and left out of the batch.
+        """
+        now = time.monotonic()
+        keys = [(name, json.dumps(arguments, sort_keys=True)) for name, arguments in calls]
+        results = [None] * len(calls)
+        pending = {} # rpc id -> slot in results
+
+        for slot, key in enumerate(keys):
+            cached = self._tool_cache.get(key) if cache else None
+            if cached and now - cached[0] < self.tool_cache_ttl:
+                results[slot] = cached[1]
+            else:
+                pending[100 + slot] = slot
+
+        if not pending:
+            return results
+
+        payload = [{
+            "jsonrpc": "2.0",
+            "method": "tools/call",
+            "params": {"name": calls[slot][0], "arguments": calls[slot][1]},
+            "id": rpc_id
+        } for rpc_id, slot in pending.items()]
+
+        for data_str in await self._post_frames(payload) or []:
+            try:
+                msg = fast_json.loads(data_str)
+            except fast_json.JSONDecodeError:
+                continue
+            # Servers may answer a batch with one array frame or one frame per call
+            for reply in msg if isinstance(msg, list) else [msg]:
+                slot = pending.get(reply.get("id")) if isinstance(reply, dict) else None
+                if slot is None:
+                    continue
+                result = self._handle_msg(reply, print_output=False)
+                if result is not None:
+                    results[slot] = result
+                    self._tool_cache[keys[slot]] = (now, result)
+        return results
+
+async def _main(url: str):
+    async with MCPClient(url) as client:
+        if await client.connect():
+            await asyncio.sleep(1)
+            await client.list_tools()
+            # Block until Ctrl-C with no periodic wakeups; the listener task keeps streaming
+            await asyncio.Event().wait()
 
 if __name__ == "__main__":
     load_dotenv()
     url = os.getenv("TAOSTATS_MCP_URL")
     if url:
-        client = MCPClient(url)
-        if client.connect():
-            time.sleep(1)
-            client.list_tools()
-            try:
-                while True: time.sleep(1)
-            except KeyboardInterrupt:
-                pass
+        try:
+            asyncio.run(_main(url))
+        except KeyboardInterrupt:
+            pass
     else:
         print("Set TAOSTATS_MCP_URL")
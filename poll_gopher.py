@@ -1,70 +1,147 @@
-import requests
+import aiohttp
+import asyncio
+import contextlib
 import json
 import time
 import sys
-import os
-from dotenv import load_dotenv
+from config import env
+from src.tools.http_retry import RETRY_STATUS, retry_after
 
-load_dotenv()
-
-GOPHER_API_KEY = os.getenv("GOPHER_API_KEY")
+GOPHER_API_KEY = env().get("GOPHER_API_KEY")
 BASE_URL = "https://data.gopher-ai.com/api/v1"
+HEADERS = {"Authorization": f"Bearer {GOPHER_API_KEY}"}
+
+# Most requests the scripts keep in flight against one host at a time
+MAX_IN_FLIGHT = 5
+
+def gopher_session():
+    """An authenticated session that several poll_gopher calls can share (must be created inside the loop)."""
+    # The transport caps connections per host too, whatever the callers' own limits
+    return aiohttp.ClientSession(headers=HEADERS, connector=aiohttp.TCPConnector(limit_per_host=MAX_IN_FLIGHT))
 
-def poll_gopher(job_id, interval=5, timeout=60):
+async def poll_gopher(job_id, interval=1.0, timeout=60, max_interval=10.0, session=None):
     """
     Polls the Gopher API for job completion.
+    The wait between polls starts at `interval` and grows 1.5x per attempt up to
+    `max_interval`; a Retry-After header on 429/503 overrides it.
+    Pass a gopher_session() as `session` to share connections across jobs.
     """
     url = f"{BASE_URL}/search/live/result/{job_id}"
-    headers = {"Authorization": f"Bearer {GOPHER_API_KEY}"}
     
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-        try:
-            print(f"Polling {url}...")
-            response = requests.get(url, headers=headers)
-            if response.status_code == 200:
-                data = response.json()
-                
-                if isinstance(data, list):
-                     print("\nJob Completed!")
-                     # Print first item to avoid massive log
-                     if len(data) > 0:
-                         print(json.dumps(data[0], indent=2))
-                         print(f"... and {len(data)-1} more items.")
-                     else:
-                         print("[] (Empty result)")
-                     return data
+    deadline = time.monotonic() + timeout
+    delay = interval
+    # One session for the whole loop: every poll reuses the kept-alive TLS connection.
+    # A caller-supplied session is borrowed, not closed.
+    async with contextlib.nullcontext(session) if session else gopher_session() as session:
+        while time.monotonic() < deadline:
+            wait = delay
+            try:
+                print(f"Polling {url}...")
+                async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as response:
+                    if response.status == 200:
+                        data = await response.json(content_type=None)
+                        
+                        if isinstance(data, list):
+                             print("\nJob Completed!")
+                             # Print first item to avoid massive log
+                             if len(data) > 0:
+                                 print(json.dumps(data[0], indent=2))
+                                 print(f"... and {len(data)-1} more items.")
+                             else:
+                                 print("[] (Empty result)")
+                             return data
 
-                status = data.get("status")
-                
-                if status == "in progress":
-                    print("Job still in progress...")
-                elif status == "completed" or "result" in data: # Check for success indicators
-                     print("\nJob Completed!")
-                     print(json.dumps(data, indent=2))
-                     return data
-                elif status == "failed":
-                    print(f"Job Failed: {data.get('error')}")
-                    return None
-                else:
-                    # If the structure is different, print what we got
-                    print(f"Unknown status or completed: {data}")
-                    return data
-            else:
-                print(f"Request failed with status {response.status_code}: {response.text}")
+                        status = data.get("status")
+                        
+                        if status == "in progress":
+                            print("Job still in progress...")
+                        elif status == "completed" or "result" in data: # Check for success indicators
+                             print("\nJob Completed!")
+                             print(json.dumps(data, indent=2))
+                             return data
+                        elif status == "failed":
+                            print(f"Job Failed: {data.get('error')}")
+                            return None
+                        else:
+                            # If the structure is different, print what we got
+                            print(f"Unknown status or completed: {data}")
+                            return data
+                    elif response.status in (429, 503):
+                        wait = retry_after(response.headers, delay)
+                        print(f"Server busy ({response.status}), retrying in {wait:.1f}s...")
+                    else:
+                        print(f"Request failed with status {response.status}: {await response.text()}")
+                    
+            except Exception as e:
+                print(f"Polling error: {e}")
                 
-        except Exception as e:
-            print(f"Polling error: {e}")
-            
-        time.sleep(interval)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(wait, remaining))
+            delay = min(delay * 1.5, max_interval)
     
     print("Polling timed out.")
     return None
 
+async def probe(session, method, url, limit=None):
+    """One request against a candidate endpoint; returns (method, url, status, body, headers)."""
+    async with limit or contextlib.nullcontext():
+        async with session.request(method, url, timeout=aiohttp.ClientTimeout(total=15)) as response:
+            return method, url, response.status, await response.text(), response.headers
+
+async def _race(session, candidates):
+    """
+    Fires the candidates concurrently, at most MAX_IN_FLIGHT at a time. Returns
+    ((method, url, body) of the first 200 or None, the longest Retry-After asked
+    for by a busy endpoint or None).
+    """
+    limit = asyncio.Semaphore(MAX_IN_FLIGHT)
+    tasks = [asyncio.create_task(probe(session, method, url, limit)) for method, url in candidates]
+    busy_wait = None
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            try:
+                method, url, status, body, headers = await next_done
+            except Exception as e:
+                print(f"Failed: {e}")
+                continue
+            print(f"{method} {url} -> Status: {status}")
+            if status == 200:
+                return (method, url, body), None
+            if status in RETRY_STATUS:
+                busy_wait = max(busy_wait or 0.0, retry_after(headers, 0.0))
+    finally:
+        for task in tasks:
+            task.cancel()
+    return None, busy_wait
+
+async def poll_first_ok(session, candidates, interval=0.5, timeout=30, max_interval=10.0):
+    """
+    Fires the (method, url) candidates concurrently, cancelling the rest on the first
+    200, and repeats the round until a candidate answers or `timeout` expires,
+    with the same backoff as poll_gopher: the first round goes out at once, the
+    wait then starts at `interval` and grows 1.5x up to `max_interval`, and a
+    longer Retry-After on 429/5xx takes precedence.
+    """
+    deadline = time.monotonic() + timeout
+    delay = interval
+    while True:
+        hit, busy_wait = await _race(session, candidates)
+        if hit:
+            return hit
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        wait = delay if busy_wait is None else max(busy_wait, delay)
+        print(f"No result yet, retrying in {min(wait, remaining):.1f}s...")
+        await asyncio.sleep(min(wait, remaining))
+        delay = min(delay * 1.5, max_interval)
+
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Usage: python3 poll_gopher.py <JOB_UUID>")
         sys.exit(1)
     
     job_uuid = sys.argv[1]
-    poll_gopher(job_uuid)
+    asyncio.run(poll_gopher(job_uuid))
@@ -1,6 +1,6 @@
 from mcp_client import MCPClient
+import asyncio
 import os
-import time
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -10,20 +10,23 @@ if not url:
     print("TAOSTATS_MCP_URL not set")
     exit(1)
 
-client = MCPClient(url)
-if client.connect():
-    time.sleep(1)
-    
-    # Try getting Stats first (general)
-    # Then try GetLatestSubnetPool for netuid 33
-    
-    print("\n--- Querying Subnet 33 Metrics ---\n")
-    client.call_tool("GetLatestSubnetPool", {"netuid": 33})
-    
-    # Keep alive briefly to get response
-    try:
-        time.sleep(5)
-    except KeyboardInterrupt:
-        pass
-else:
-    print("Failed to connect")
+async def main():
+    async with MCPClient(url) as client:
+        if await client.connect():
+            await asyncio.sleep(1)
+            
+            # Try getting Stats first (general)
+            # Then try GetLatestSubnetPool for netuid 33
+            
+            print("\n--- Querying Subnet 33 Metrics ---\n")
+            await client.call_tool("GetLatestSubnetPool", {"netuid": 33})
+            
+            # Keep alive briefly to get response
+            await asyncio.sleep(5)
+        else:
+            print("Failed to connect")
+
+try:
+    asyncio.run(main())
+except KeyboardInterrupt:
+    pass
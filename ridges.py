@@ -1,10 +1,17 @@
 import os
 import re
+import time
+import hashlib
+from pathlib import Path
 from rich.console import Console
 from openai import Client
+from config import verbose
 
 console = Console()
 
+# Markdown code fences (```python / ``` with an optional trailing newline), compiled once
+_FENCE_RE = re.compile(r"```(?:python)?\n?")
+
 class RidgesGenerator:
     """
     Adapter for Ridges (Subnet 62) - Secure Automation Generation.
@@ -16,6 +23,11 @@ class RidgesGenerator:
         self.api_key = os.getenv("TARGON_API_KEY") or os.getenv("CHUTES_API_KEY")
         self.base_url = "https://api.targon.com/v1" if os.getenv("TARGON_API_KEY") else "https://llm.chutes.ai/v1"
         self.model = os.getenv("RIDGES_MODEL", "deepseek-ai/DeepSeek-V3") # capable coder
+        # OPENCLAW_VERBOSE=0 silences the live token echo
+        self.verbose = verbose()
+        # Generated scripts are cached on disk per (model, url, instruction) for cache_ttl seconds
+        self.cache_dir = Path(os.getenv("RIDGES_CACHE_DIR", ".ridges_cache"))
+        self.cache_ttl = 86400.0
         
         if self.api_key:
             self.client = Client(api_key=self.api_key, base_url=self.base_url)
@@ -55,20 +67,66 @@ class RidgesGenerator:
         if not self.client:
             return self._mock_generation(url)
 
+        cache_path = self._cache_path(url, instruction)
+        cached = self._read_cache(cache_path)
+        if cached is not None:
+            console.print(f"[dim]Ridges: reusing cached script {cache_path.name[:8]}...[/dim]")
+            return cached
+
         try:
-            response = self.client.chat.completions.create(
+            # Stream so the script shows up as it is written instead of after all 2000 tokens
+            stream = self.client.chat.completions.create(
                 model=self.model,
                 messages=[{"role": "user", "content": prompt}],
-                max_tokens=2000
+                max_tokens=2000,
+                stream=True
             )
-            code = response.choices[0].message.content
+            chunks = []
+            for event in stream:
+                delta = event.choices[0].delta.content if event.choices else None
+                if delta:
+                    if self.verbose:
+                        console.print(delta, end="", markup=False, highlight=False)
+                    chunks.append(delta)
+            if chunks and self.verbose:
+                console.print()
+            code = "".join(chunks)
             # Strip markdown fence if present
-            code = re.sub(r"```python\n|```", "", code)
+            code = _FENCE_RE.sub("", code)
+            if not code.strip():
+                # Empty or fence-only completion: never cache it, use the fallback
+                console.print("[yellow]Ridges: empty generation, using fallback script.[/yellow]")
+                return self._mock_generation(url)
+            self._write_cache(cache_path, code)
             return code
         except Exception as e:
             console.print(f"[red]Ridges Generation Failed: {e}[/red]")
             return self._mock_generation(url)
 
+    def _cache_path(self, url: str, instruction: str) -> Path:
+        key = hashlib.sha256(f"{self.model}|{url}|{instruction}".encode()).hexdigest()
+        return self.cache_dir / f"{key}.py"
+
+    def _read_cache(self, path: Path):
+        """Returns the cached script if it exists and is younger than cache_ttl, else None."""
+        try:
+            if time.time() - path.stat().st_mtime < self.cache_ttl:
+                # An empty entry (written before empty generations were rejected) is a miss
+                return path.read_text() or None
+        except OSError:
+            pass
+        return None
+
+    def _write_cache(self, path: Path, code: str):
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so a concurrent reader never sees a partial script
+            tmp = path.with_suffix(".tmp")
+            tmp.write_text(code)
+            tmp.replace(path)
+        except OSError as e:
+            console.print(f"[yellow]Ridges: could not cache script: {e}[/yellow]")
+
     def _mock_generation(self, url):
         return f"""
 from selenium import webdriver
@@ -10,6 +10,8 @@ class SoulManager:
     def __init__(self, soul_path="SOUL.md"):
         self.soul_path = soul_path
         self.trainer = TrajectoryTrainer()
+        # ((st_mtime_ns, st_size), content) of the last read; external edits change the stamp
+        self._soul_cache = None
 
     def refresh_soul(self):
         """
@@ -28,15 +30,27 @@ class SoulManager:
         Reads the current SOUL.md content to be used as system prompt.
         If file doesn't exist, fetching a new one first.
         """
-        if not os.path.exists(self.soul_path):
+        try:
+            st = os.stat(self.soul_path)
+        except FileNotFoundError:
             print("[yellow]SOUL.md not found. Initializing from Academy (SN11)...[/yellow]")
             self.refresh_soul()
-        
+            try:
+                st = os.stat(self.soul_path)
+            except OSError:
+                return "You are a default AI assistant."
+
+        stamp = (st.st_mtime_ns, st.st_size)
+        if self._soul_cache and self._soul_cache[0] == stamp:
+            return self._soul_cache[1]
+
         try:
             with open(self.soul_path, "r") as f:
-                return f.read()
+                content = f.read()
         except:
             return "You are a default AI assistant."
+        self._soul_cache = (stamp, content)
+        return content
 
     def _write_soul(self, opp: dict):
         """
@@ -13,6 +13,20 @@ class BrainRouter:
     def __init__(self):
         # Carregando credenciais da armadura
         self.chutes_key = os.getenv("CHUTES_API_KEY")
+
+        # Tabela de rotas: chave -> (diretriz, rota, conector). Privacidade tem precedência
+        # sobre complexidade; qualquer chave desconhecida cai na rota padrão (Targon).
+        self._routes = {
+            "PRIVACY": ("🔒 DIRETRIZ: Privacidade Extrema.",
+                        "🌐 ROTA: Chutes TEE (SN64) - Modelo Kimi K2.5 Ativado.",
+                        self._call_sn64_chutes),
+            "CRITICAL": ("⚡ DIRETRIZ: Resolução de Problema Complexo.",
+                         "🌐 ROTA: Affine Cortex (SN120) - Lógica Profunda Ativada.",
+                         self._call_sn120_affine),
+        }
+        self._default_route = ("🎯 DIRETRIZ: Operação Padrão.",
+                               "🌐 ROTA: Targon (SN4) - Raciocínio Geral Ativado.",
+                               self._call_sn4_targon)
         
     def process_mission(self, prompt: str, complexity: str = "NORMAL", requires_privacy: bool = False):
         """
@@ -20,23 +34,12 @@ class BrainRouter:
         """
         print(f"\n🧠 [BrainRouter] Analisando missão: '{prompt[:40]}...'")
         
-        # 1. Rota de Privacidade Máxima (Bunker TEE)
-        if requires_privacy:
-            print("🔒 DIRETRIZ: Privacidade Extrema.")
-            print("🌐 ROTA: Chutes TEE (SN64) - Modelo Kimi K2.5 Ativado.")
-            return self._call_sn64_chutes(prompt)
-            
-        # 2. Rota de Lógica Crítica / Hiper-Raciocínio
-        elif complexity == "CRITICAL":
-            print("⚡ DIRETRIZ: Resolução de Problema Complexo.")
-            print("🌐 ROTA: Affine Cortex (SN120) - Lógica Profunda Ativada.")
-            return self._call_sn120_affine(prompt)
-            
-        # 3. Rota Padrão (Estratégia Geral / Custo-Benefício)
-        else:
-            print("🎯 DIRETRIZ: Operação Padrão.")
-            print("🌐 ROTA: Targon (SN4) - Raciocínio Geral Ativado.")
-            return self._call_sn4_targon(prompt)
+        # 1. Privacidade Máxima (Bunker TEE) > 2. Lógica Crítica > 3. Rota Padrão
+        key = "PRIVACY" if requires_privacy else complexity
+        directive, route, connector = self._routes.get(key, self._default_route)
+        print(directive)
+        print(route)
+        return connector(prompt)
 
     # ==========================================
     # CONECTORES DAS SUB-REDES (Stubs)
@@ -0,0 +1,240 @@
+# ====================================================================
+# NOME DO ARQUIVO: coingecko_sentinel.py
+# LOCAL: Salvar na pasta src/finance/
+# TEMA: Base dos simuladores de paper trading (Oráculo, diário e Modo Vigília)
+# ====================================================================
+
+import asyncio
+import atexit
+import logging
+import time
+import aiohttp
+import queue
+import random
+import threading
+from functools import lru_cache
+
+import fast_json
+from src.tools.http_retry import RETRY_STATUS, retry_after
+
+_PRICE_URL = "https://api.coingecko.com/api/v3/simple/price?ids={}&vs_currencies=usd"
+
+@lru_cache(maxsize=32)
+def _price_url(api_ids: tuple) -> str:
+    """URL do /simple/price para um conjunto de ids; montada uma única vez por combinação."""
+    return _PRICE_URL.format(",".join(api_ids))
+
+class CoinGeckoSentinel:
+    """
+    Base dos simuladores: cotações reais da CoinGecko, diário de trades em segundo
+    plano e o Loop de Vigília. As subclasses definem a estratégia em _trade().
+    """
+    # Formato da hora e linhas do diário em texto (lado da operação -> modelo)
+    _TS_FMT = '%H:%M:%S'
+    _LOG_TMPL = {}
+    # Mensagens do Loop de Vigília
+    _CYCLE_MSG = "--- 🔄 Ciclo Operacional #%d ---"
+    _IDLE_MSG = "    💤 Nada a fazer: cotações não consultadas neste ciclo."
+    _SLEEP_MSG = "😴 Fim do Ciclo %d. Hibernando %g minuto(s)...\n"
+
+    def __init__(self, logger_name: str, cache_ttl: float = 30.0, log_format: str = "ndjson"):
+        # "ndjson": um registro JSON compacto por trade; "text": a linha legível tradicional
+        self.log_format = log_format
+        # Mensagens por operação/ciclo; os argumentos só são formatados se o nível estiver ativo
+        self.log = logging.getLogger(logger_name)
+        self.log_file = "historico_de_trades_reais.ndjson" if log_format == "ndjson" else "historico_de_trades_reais.txt"
+        # Registros do diário vão para uma fila; uma thread em segundo plano os formata e grava
+        self._log_q = queue.Queue()
+        self._log_writer = None
+        # Caixa em centavos inteiros: somas e subtrações exatas, sem erro acumulado de float
+        self._cash_cents = 1_000_000 # $10.000 dólares imaginários
+
+        # ativo -> (cotação, instante da consulta); cotações recentes não geram nova chamada à API
+        self._price_cache = {}
+        self.cache_ttl = cache_ttl
+        # Backoff exponencial com jitter quando a CoinGecko limita as requisições
+        self.max_retries = 4
+        self.backoff_base = 1.0
+        self.backoff_cap = 30.0
+        # Ciclos seguidos sem nada a fazer (_can_trade() falso); cada um dobra a hibernação,
+        # até max_idle_interval. Com posição aberta o ciclo nunca é ocioso: o take profit
+        # precisa ser conferido no intervalo normal mesmo sem operar.
+        self._idle_cycles = 0
+        self.max_idle_interval = 3600.0
+        # Sessão HTTP reaproveitada entre ciclos (keep-alive: um único handshake TLS com a
+        # CoinGecko); criada na primeira consulta, pois precisa do event loop em execução
+        self.session = None
+        # Sinalizado por stop(): interrompe a hibernação e encerra o Modo Vigília
+        self._stop = asyncio.Event()
+
+        self.crypto_ids = {"BTC": "bitcoin", "ETH": "ethereum", "SOL": "solana"}
+        # Estratégia de cada ciclo: ativo -> valor em USD a comprar
+        self.ordens = {"BTC": 100.00, "ETH": 50.00}
+
+    @property
+    def caixa_virtual(self) -> float:
+        """Caixa em dólares; convertido dos centavos inteiros só na hora de exibir/registrar."""
+        return self._cash_cents / 100
+
+    async def _get_real_price(self, asset: str) -> float:
+        """Consulta a API pública da CoinGecko."""
+        return (await self._get_real_prices([asset])).get(asset, 0.0)
+
+    async def _get_real_prices(self, assets: list) -> dict:
+        """Consulta a cotação de vários ativos numa única chamada à CoinGecko."""
+        agora = time.monotonic()
+        precos = {}
+        for a in assets:
+            cached = self._price_cache.get(a)
+            if cached and agora - cached[1] < self.cache_ttl:
+                precos[a] = cached[0]
+        ids = {self.crypto_ids[a]: a for a in assets if a in self.crypto_ids and a not in precos}
+        if not ids:
+            return precos
+
+        try:
+            dados = await self._fetch_usd(ids)
+            for api_id, asset in ids.items():
+                if api_id in dados:
+                    precos[asset] = float(dados[api_id]["usd"])
+                    self._price_cache[asset] = (precos[asset], agora)
+        except Exception as e:
+            self.log.warning("    ❌ [Alerta] Falha de conexão com o Oráculo: %s", e)
+        return precos
+
+    async def _fetch_usd(self, api_ids) -> dict:
+        """GET /simple/price para os ids da CoinGecko informados; devolve o JSON da resposta."""
+        url = _price_url(tuple(api_ids))
+        if self.session is None:
+            self.session = aiohttp.ClientSession(
+                # DNS da CoinGecko resolvido uma vez e fixado pela vida da sessão (os ciclos
+                # são mais longos que qualquer TTL curto, então cada um resolveria de novo)
+                connector=aiohttp.TCPConnector(limit=4, ttl_dns_cache=None),
+                headers={"Accept-Encoding": "gzip"}
+            )
+        for tentativa in range(self.max_retries + 1):
+            try:
+                async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as resposta:
+                    if resposta.status not in RETRY_STATUS or tentativa == self.max_retries:
+                        resposta.raise_for_status()
+                        return fast_json.loads(await resposta.read())
+                    espera = retry_after(resposta.headers, self._backoff(tentativa))
+            except aiohttp.ClientConnectorError:
+                # O endereço fixado pode ter mudado: a próxima conexão resolve o DNS de novo
+                self.session.connector.clear_dns_cache()
+                raise
+            self.log.warning("    ⏳ [Oráculo] CoinGecko respondeu %s; nova tentativa em %.1fs...", resposta.status, espera)
+            if await self._hibernate(espera):
+                return {} # stop() durante a espera
+
+    def _backoff(self, tentativa: int) -> float:
+        """Espera exponencial (base * 2^tentativa, limitada a backoff_cap) com jitter de ±50%."""
+        return min(self.backoff_cap, self.backoff_base * 2 ** tentativa) * random.uniform(0.5, 1.5)
+
+    def _write_log(self, registro: dict):
+        """Entrega o registro ao escritor do diário; o ciclo de trading não espera o disco."""
+        if self._log_writer is None:
+            self._log_writer = threading.Thread(target=self._drain_log, daemon=True)
+            self._log_writer.start()
+            atexit.register(self._stop_log_writer)
+        self._log_q.put(registro)
+
+    def _drain_log(self):
+        # Modo binário: as linhas chegam prontas em bytes, sem a camada de texto do io
+        with open(self.log_file, "ab", buffering=64 * 1024) as fp:
+            while True:
+                registro = self._log_q.get()
+                if registro is None: # sinal de parada
+                    break
+                fp.write(self._format_log(registro))
+                if self._log_q.empty():
+                    fp.flush() # fila vazia: o que chegou até aqui já está em disco
+
+    def _format_log(self, registro: dict) -> bytes:
+        if self.log_format == "ndjson":
+            return fast_json.dumpb(registro) + b"\n"
+        tmpl = self._LOG_TMPL[registro["side"]]
+        return tmpl.format(**{**registro, "ts": time.strftime(self._TS_FMT, time.localtime(registro["ts"]))}).encode()
+
+    def _stop_log_writer(self):
+        """Grava as linhas pendentes e encerra o escritor do diário."""
+        if self._log_writer:
+            self._log_q.put(None)
+            self._log_writer.join(timeout=2)
+            self._log_writer = None
+
+    def _next_interval(self, ocioso: bool, interval_seconds: float) -> float:
+        """Intervalo até o próximo ciclo: o normal enquanto há o que vigiar, dobrando a cada ciclo ocioso."""
+        # (contador limitado: 2**32 já passa de qualquer teto e evita estouro de float)
+        self._idle_cycles = min(self._idle_cycles + 1, 32) if ocioso else 0
+        teto = max(interval_seconds, self.max_idle_interval)
+        return min(interval_seconds * 2 ** self._idle_cycles, teto)
+
+    def stop(self):
+        """Pede ao Modo Vigília que encerre; a hibernação em curso termina imediatamente."""
+        self._stop.set()
+
+    async def _hibernate(self, segundos: float) -> bool:
+        """Dorme até `segundos` ou até stop(); devolve True se for hora de encerrar."""
+        try:
+            await asyncio.wait_for(self._stop.wait(), timeout=segundos)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def close(self):
+        """Fecha a sessão HTTP com a CoinGecko e o diário de trades."""
+        if self.session:
+            await self.session.close()
+            self.session = None
+        await asyncio.to_thread(self._stop_log_writer)
+
+    async def _trade(self, asset: str, valor: float, preco_atual: float = None) -> bool:
+        """Estratégia do ciclo para um ativo; devolve True se operou."""
+        raise NotImplementedError
+
+    def _can_trade(self) -> bool:
+        """Há caixa para ao menos a menor ordem da estratégia?"""
+        return self._cash_cents >= round(min(self.ordens.values()) * 100)
+
+    def _report(self):
+        """Relatório impresso ao sair do Modo Vigília."""
+        print(f"💼 Caixa Final: ${self.caixa_virtual:.2f}")
+
+    async def _vigil_loop(self, interval_minutes: int):
+        """O Loop Infinito. O agente acorda, opera e volta a dormir."""
+        ciclo = 1
+        interval_seconds = interval_minutes * 60
+        # Ciclos presos a uma grade fixa no relógio monotônico: o tempo gasto no ciclo
+        # sai da hibernação em vez de se somar a ela
+        proximo_ciclo = time.monotonic()
+        try:
+            while not self._stop.is_set():
+                self.log.info(self._CYCLE_MSG, ciclo)
+                ocioso = not self._can_trade()
+                if not ocioso:
+                    # Uma única consulta traz todas as cotações do ciclo (sem pausa anti-bloqueio entre ativos)
+                    precos = await self._get_real_prices(list(self.ordens))
+                    # Ativos que faltaram no lote buscam a própria cotação, em paralelo. O estado
+                    # do simulador só muda entre awaits, então as avaliações não precisam de trava.
+                    await asyncio.gather(*(
+                        self._trade(asset, valor, precos.get(asset))
+                        for asset, valor in self.ordens.items()
+                    ))
+                else:
+                    self.log.info(self._IDLE_MSG)
+
+                intervalo = self._next_interval(ocioso, interval_seconds)
+                self.log.info(self._SLEEP_MSG, ciclo, intervalo / 60)
+                ciclo += 1
+                proximo_ciclo += intervalo
+                espera = proximo_ciclo - time.monotonic()
+                if espera < 0: # ciclo mais longo que o intervalo: realinha em vez de disparar ciclos atrasados
+                    proximo_ciclo, espera = time.monotonic(), 0
+                # O agente dorme aqui sem bloquear o event loop; stop() o acorda na hora
+                if await self._hibernate(espera):
+                    break
+        finally:
+            # Ctrl+C (asyncio.run cancela o ciclo) ou stop()
+            self._report()
+            await self.close()
@@ -4,112 +4,114 @@
 # TEMA: Simulação de Combate com Loop de Vigília e Realização de Lucro (Take Profit)
 # ====================================================================
 
+import asyncio
+import logging
 import time
-import requests
-from datetime import datetime
 import sys
 
-class RealDataPaperTrading:
+from src.finance.coingecko_sentinel import CoinGeckoSentinel
+
+class RealDataPaperTrading(CoinGeckoSentinel):
     """
     Simulador de Combate Definitivo.
     O agente opera em Loop, compra na baixa e VENDE automaticamente ao atingir a meta de lucro.
     """
-    def __init__(self):
-        self.log_file = "historico_de_trades_reais.txt"
-        self.caixa_virtual = 10000.00
+    # Linhas do diário em texto; os campos vêm direto do registro da operação
+    _LOG_TMPL = {
+        "SELL": "[{ts}] 🟢 VENDA (LUCRO) | {asset} | Preço: ${px} | Lucro: +${pnl:.2f} | Caixa: ${cash:.2f}\n",
+        "BUY": "[{ts}] 🔴 COMPRA | {asset} | Preço: ${px} | Investido: ${usd} | Caixa: ${cash:.2f}\n",
+    }
+    _IDLE_MSG = "    💤 Sem caixa e sem posições: cotações não consultadas neste ciclo."
+    _NO_CASH_MSG = "    ❌ Sem saldo para comprar %s. Aguardando vendas para fazer caixa."
+
+    def __init__(self, cache_ttl: float = 30.0, log_format: str = "ndjson"):
+        super().__init__("openclaw.paper_trading", cache_ttl, log_format)
         self.meta_lucro = 1.05  # Meta de 5% de lucro para vender (Take Profit)
         
-        # O Agente agora tem uma "Mochila" para guardar o que comprou
+        # O Agente agora tem uma "Mochila" para guardar o que comprou; o preço médio pago
+        # (avg_cost) é atualizado a cada compra, não recalculado a cada ciclo
         self.portfolio = {
-            "BTC": {"quantidade": 0.0, "total_gasto": 0.0},
-            "ETH": {"quantidade": 0.0, "total_gasto": 0.0},
-            "SOL": {"quantidade": 0.0, "total_gasto": 0.0}
+            "BTC": {"quantidade": 0.0, "avg_cost": 0.0},
+            "ETH": {"quantidade": 0.0, "avg_cost": 0.0},
+            "SOL": {"quantidade": 0.0, "avg_cost": 0.0}
         }
         
         print("\n🌐 [Oráculo] Sensores de mercado online.")
         print(f"💰 [Caixa Virtual]: ${self.caixa_virtual:.2f}")
         print(f"🎯 [Estratégia]: Vender automaticamente com {(self.meta_lucro - 1) * 100}% de lucro.\n")
 
-        self.crypto_ids = {"BTC": "bitcoin", "ETH": "ethereum", "SOL": "solana"}
-
-    def _get_real_price(self, asset: str) -> float:
-        """Consulta a API pública da CoinGecko."""
-        api_id = self.crypto_ids.get(asset)
-        if not api_id: return 0.0
-        url = f"https://api.coingecko.com/api/v3/simple/price?ids={api_id}&vs_currencies=usd"
-        try:
-            resposta = requests.get(url, timeout=5)
-            return float(resposta.json()[api_id]["usd"])
-        except Exception:
-            return 0.0
-
-    def evaluate_and_trade(self, asset: str, amount_usd_to_buy: float):
-        """Lógica do Agente: Avalia se deve VENDER o que tem, ou COMPRAR mais."""
-        preco_atual = self._get_real_price(asset)
-        if preco_atual == 0.0: return
+    async def evaluate_and_trade(self, asset: str, amount_usd_to_buy: float, preco_atual: float = None) -> bool:
+        """Lógica do Agente: Avalia se deve VENDER o que tem, ou COMPRAR mais. Devolve True se operou."""
+        if preco_atual is None:
+            preco_atual = await self._get_real_price(asset)
+        if not preco_atual: return False
         
         # 1. VERIFICA SE TEMOS LUCRO PARA VENDER (TAKE PROFIT)
         inventario = self.portfolio[asset]
         if inventario["quantidade"] > 0:
-            preco_medio_pago = inventario["total_gasto"] / inventario["quantidade"]
-            
             # Se o preço atual for 5% maior que o preço médio que pagamos...
-            if preco_atual >= (preco_medio_pago * self.meta_lucro):
+            if preco_atual >= (inventario["avg_cost"] * self.meta_lucro):
                 valor_venda = inventario["quantidade"] * preco_atual
-                lucro_liquido = valor_venda - inventario["total_gasto"]
+                lucro_liquido = (preco_atual - inventario["avg_cost"]) * inventario["quantidade"]
                 
                 # Executa a Venda
-                self.caixa_virtual += valor_venda
-                mensagem = (f"[{datetime.now().strftime('%H:%M:%S')}] 🟢 VENDA (LUCRO) | {asset} | "
-                            f"Preço: ${preco_atual} | Lucro: +${lucro_liquido:.2f} | Caixa: ${self.caixa_virtual:.2f}\n")
+                self._cash_cents += round(valor_venda * 100)
+                registro = {"ts": int(time.time()), "side": "SELL", "asset": asset, "px": preco_atual,
+                            "pnl": lucro_liquido, "cash": self.caixa_virtual}
                 
-                print(f"    🤑 [TAKE PROFIT] Vendeu {asset} com lucro de ${lucro_liquido:.2f}!")
+                self.log.info("    🤑 [TAKE PROFIT] Vendeu %s com lucro de $%.2f!", asset, lucro_liquido)
                 
-                # Zera a mochila deste ativo
-                self.portfolio[asset] = {"quantidade": 0.0, "total_gasto": 0.0}
+                # Zera a mochila deste ativo (no próprio registro, sem alocar outro)
+                inventario["quantidade"] = inventario["avg_cost"] = 0.0
                 
-                with open(self.log_file, "a") as file:
-                    file.write(mensagem)
-                return # Encerra o turno deste ativo, já vendemos.
+                self._write_log(registro)
+                return True # Encerra o turno deste ativo, já vendemos.
 
         # 2. SE NÃO VENDEU, TENTA COMPRAR MAIS (ACUMULAÇÃO)
-        if amount_usd_to_buy <= self.caixa_virtual:
-            self.caixa_virtual -= amount_usd_to_buy
+        custo_cents = round(amount_usd_to_buy * 100)
+        if custo_cents <= self._cash_cents:
+            self._cash_cents -= custo_cents
             qtd_comprada = amount_usd_to_buy / preco_atual
             
-            # Guarda na mochila
-            self.portfolio[asset]["quantidade"] += qtd_comprada
-            self.portfolio[asset]["total_gasto"] += amount_usd_to_buy
+            # Guarda na mochila, atualizando o preço médio pago
+            qtd_antiga = inventario["quantidade"]
+            nova_qtd = qtd_antiga + qtd_comprada
+            inventario["avg_cost"] = (inventario["avg_cost"] * qtd_antiga + amount_usd_to_buy) / nova_qtd
+            inventario["quantidade"] = nova_qtd
             
-            mensagem = (f"[{datetime.now().strftime('%H:%M:%S')}] 🔴 COMPRA | {asset} | "
-                        f"Preço: ${preco_atual} | Investido: ${amount_usd_to_buy} | Caixa: ${self.caixa_virtual:.2f}\n")
+            registro = {"ts": int(time.time()), "side": "BUY", "asset": asset, "px": preco_atual,
+                        "usd": amount_usd_to_buy, "qty": qtd_comprada, "cash": self.caixa_virtual}
             
-            print(f"    🛒 Comprou {qtd_comprada:.6f} {asset} a ${preco_atual}")
+            self.log.info("    🛒 Comprou %.6f %s a $%s", qtd_comprada, asset, preco_atual)
             
-            with open(self.log_file, "a") as file:
-                file.write(mensagem)
-        else:
-            print(f"    ❌ Sem saldo para comprar {asset}. Aguardando vendas para fazer caixa.")
+            self._write_log(registro)
+            return True
+        self.log.info(self._NO_CASH_MSG, asset)
+        return False
 
-    def start_vigil_mode(self, interval_minutes: int):
+    async def _trade(self, asset: str, valor: float, preco_atual: float = None) -> bool:
+        return await self.evaluate_and_trade(asset, valor, preco_atual)
+
+    def _can_trade(self) -> bool:
+        """Há algo a fazer neste ciclo? (caixa para a menor ordem, ou posição aberta para vender)"""
+        return (super()._can_trade()
+                or any(inv["quantidade"] > 0 for inv in self.portfolio.values()))
+
+    def _report(self):
+        print("\n🛑 Sistema Desativado pelo Comandante.")
+        super()._report()
+
+    async def start_vigil_mode(self, interval_minutes: int):
         print(f"🦉 [Sentinela] Modo Vigília ativado. Loop de {interval_minutes} minuto(s). [Ctrl+C] para sair.\n")
-        ciclo = 1
-        interval_seconds = interval_minutes * 60
-        try:
-            while True:
-                print(f"--- 🔄 Ciclo Operacional #{ciclo} ---")
-                self.evaluate_and_trade("BTC", 100.00) 
-                time.sleep(3) 
-                self.evaluate_and_trade("ETH", 50.00)  
-                
-                print(f"😴 Fim do Ciclo {ciclo}. Hibernando...\n")
-                ciclo += 1
-                time.sleep(interval_seconds) 
-        except KeyboardInterrupt:
-            print("\n🛑 Sistema Desativado pelo Comandante.")
-            print(f"💼 Caixa Final: ${self.caixa_virtual:.2f}")
-            sys.exit(0)
+        await self._vigil_loop(interval_minutes)
 
 if __name__ == "__main__":
+    # OPENCLAW_VERBOSE=0 silencia as mensagens por operação (avisos continuam visíveis)
+    from config import verbose
+    logging.basicConfig(level=logging.INFO if verbose() else logging.WARNING,
+                        format="%(message)s")
     simulador = RealDataPaperTrading()
-    simulador.start_vigil_mode(interval_minutes=1)
+    try:
+        asyncio.run(simulador.start_vigil_mode(interval_minutes=1))
+    except KeyboardInterrupt:
+        sys.exit(0)
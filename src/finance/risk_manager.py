@@ -1,5 +1,6 @@
 import time
 import random
+import asyncio
 
 class RiskManager:
     """
@@ -69,6 +70,23 @@ class RiskManager:
         print(f"    🚀 [GREEN LIGHT] Risco mitigado. Autorização concedida para operação financeira.")
         return True
 
+    async def evaluate_deployment_async(self, asset: str, contract_address: str, amount_usd: float) -> bool:
+        """
+        Mesma decisão de evaluate_deployment, mas a auditoria SN100 e a análise
+        de mercado são independentes e rodam em paralelo. Ambas precisam aprovar.
+        """
+        print(f"\n⚖️ [Comitê de Risco] Avaliando deploy de ${amount_usd} no ativo {asset}...")
+
+        is_code_safe, is_market_stable = await asyncio.gather(
+            asyncio.to_thread(self._audit_smart_contract_sn100, contract_address),
+            asyncio.to_thread(self._analyze_market_conditions, asset),
+        )
+        if not (is_code_safe and is_market_stable):
+            return False
+
+        print(f"    🚀 [GREEN LIGHT] Risco mitigado. Autorização concedida para operação financeira.")
+        return True
+
 # ==========================================
 # TESTE DO SISTEMA (Para rodar localmente)
 # ==========================================
@@ -1,4 +1,6 @@
+import asyncio
 import os
+import time
 import requests
 from dotenv import load_dotenv
 
@@ -16,6 +18,13 @@ class HippiusVault:
         self.api_key = os.getenv("HIPPIUS_API_KEY")
         self.endpoint = "https://api.hippius.tao/v1/storage"
 
+        # Fila de gravações pendentes, drenada por uma única tarefa escritora (criadas
+        # no primeiro enqueue_save, pois precisam do event loop em execução)
+        self._queue = None
+        self._writer = None
+        self.batch_size = 32
+        self.flush_interval = 1.0 # segundos que o escritor espera para juntar um lote
+
     def save_memory(self, filename: str, content: str):
         """
         Salva logs, relatórios ou dados estruturados na nuvem descentralizada.
@@ -43,6 +52,51 @@ class HippiusVault:
             print(f"    ❌ [Erro de Memória] Falha ao trancar arquivo: {e}")
             return None
 
+    async def save_memory_async(self, filename: str, content: str):
+        """Versão assíncrona de save_memory: o envio roda numa thread, fora do event loop."""
+        return await asyncio.to_thread(self.save_memory, filename, content)
+
+    def enqueue_save(self, filename: str, content: str):
+        """
+        Agenda a gravação e retorna imediatamente, sem esperar a confirmação da rede.
+        Gravações próximas no tempo são enviadas juntas, como um único arquivo.
+        Use flush() antes de encerrar o loop para não perder memórias pendentes.
+        """
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._write_batches())
+        self._queue.put_nowait((filename, content))
+
+    async def flush(self):
+        """Espera até que todas as gravações agendadas tenham sido enviadas."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def _write_batches(self):
+        while True:
+            batch = [await self._queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                if len(batch) == 1:
+                    filename, content = batch[0]
+                else:
+                    filename = f"memory_batch_{int(time.time())}_{len(batch)}.txt"
+                    content = "\n".join(f"=== {name} ===\n{body}" for name, body in batch)
+                await self.save_memory_async(filename, content)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
     def retrieve_memory(self, file_hash: str):
         """
         Recupera um arquivo da rede a partir do seu Hash único.
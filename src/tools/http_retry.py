@@ -0,0 +1,13 @@
+"""
+Regras de nova tentativa compartilhadas pelos clientes HTTP (CoinGecko, Gopher).
+"""
+
+# Respostas que valem nova tentativa (limite de requisições / instabilidade do servidor)
+RETRY_STATUS = (429, 502, 503, 504)
+
+def retry_after(headers, default):
+    """Segundos de espera do cabeçalho Retry-After numérico, senão `default`."""
+    try:
+        return max(0.0, float(headers.get("Retry-After", default)))
+    except ValueError: # formato data HTTP; usa o nosso próprio backoff
+        return default
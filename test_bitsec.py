@@ -1,8 +1,9 @@
 from bitsec_auditor import BitsecAuditor, SecurityException
 import os
-from dotenv import load_dotenv
+from config import env
 
-load_dotenv()
+# Loads .env into os.environ for the client, once per process
+env()
 
 SAFE_CODE = """
 def add(a, b):
@@ -1,4 +1,4 @@
-from brain import BrainRouter
+from brain import get_brain
 from rich.console import Console
 
 console = Console()
@@ -6,7 +6,7 @@ console = Console()
 def test_cortex_edition():
     console.print("[bold white]🧪 Testing Cortex Edition v2.6 (Subnet 120)...[/bold white]")
     
-    brain = BrainRouter()
+    brain = get_brain()
     
     # Level 1: Reflex
     console.print("\n[cyan]Target: Level 1 (Reflex)[/cyan]")
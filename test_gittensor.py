@@ -1,4 +1,4 @@
-from brain import BrainRouter
+from brain import get_brain
 from rich.console import Console
 
 console = Console()
@@ -6,7 +6,7 @@ console = Console()
 def test_gittensor_integration():
     console.print("[bold white]🧪 Testing Gittensor (SN74) Integration...[/bold white]")
     
-    brain = BrainRouter()
+    brain = get_brain()
     
     # Check if client loaded repos
     repo_count = len(brain.gittensor_client.repos)
@@ -1,12 +1,9 @@
-import os
 import requests
-import json
-from dotenv import load_dotenv
+import fast_json
+from config import env
 
-# Load environment variables
-load_dotenv()
-
-api_key = os.getenv("GOPHER_API_KEY")
+# .env is parsed once per process by config.env()
+api_key = env().get("GOPHER_API_KEY")
 url = "https://data.gopher-ai.com/api/v1/search/live"
 
 headers = {
@@ -29,9 +26,9 @@ try:
     print(f"Status Code: {response.status_code}")
     
     if response.status_code == 200:
-        data = response.json()
         # Print FULL structure to understand how to parse
-        print(json.dumps(data, indent=2)) 
+        # (orjson-backed when installed: parse and re-indent in one fast pass each)
+        print(fast_json.dumps(fast_json.loads(response.content), indent=True))
     else:
         print(f"Failed: {response.text}")
 
@@ -1,23 +1,9 @@
-import os
-import requests
-import json
-import time
-from dotenv import load_dotenv
+import asyncio
+from gopher_cache import submit_job
+from poll_gopher import BASE_URL, gopher_session, poll_first_ok
 
-# Load environment variables
-load_dotenv()
+base_url = BASE_URL
 
-api_key = os.getenv("GOPHER_API_KEY")
-base_url = "https://data.gopher-ai.com/api/v1"
-
-headers = {
-    "Authorization": f"Bearer {api_key}",
-    "Content-Type": "application/json"
-}
-
-# 1. Start the Job
-print("\n--- Starting Search Job ---")
-start_url = f"{base_url}/search/live"
 payload = {
     "type": "twitter",
     "arguments": {
@@ -27,39 +13,39 @@ payload = {
     }
 }
 
-try:
-    response = requests.post(start_url, headers=headers, json=payload)
-    data = response.json()
-    job_id = data.get("uuid")
-    
-    if not job_id:
-        print("Failed to get UUID. Exiting.")
-        exit(1)
-        
-    print(f"Got Job ID: {job_id}")
-    
-    # 2. Test Final Alternatives
-    alternatives = [
-        {"method": "GET", "url": f"{base_url}/job/{job_id}"},
-        {"method": "GET", "url": f"{base_url}/result/{job_id}"},
-        {"method": "GET", "url": f"{base_url}/results/{job_id}"},
-        {"method": "GET", "url": f"{base_url}/search/{job_id}"},
-    ]
-    
-    print("\n--- Testing Singular Alternatives ---")
-    time.sleep(2) 
-    
-    for alt in alternatives:
-        print(f"Testing {alt['method']} {alt['url']}...")
-        try:
-            resp = requests.get(alt['url'], headers=headers)
-            print(f"Status: {resp.status_code}")
-            if resp.status_code == 200:
-                print(">>> SUCCESS! <<<")
-                print(resp.text[:200])
-                break
-        except Exception as e:
-            print(f"Failed: {e}")
+async def main():
+    async with gopher_session() as session:
+        # 1. Start the Job
+        print("\n--- Starting Search Job ---")
+        start_url = f"{base_url}/search/live"
+        # Reuses the job started by a run in the last minute for the same query
+        data = await submit_job(session, start_url, payload)
+        job_id = data.get("uuid")
+
+        if not job_id:
+            print("Failed to get UUID. Exiting.")
+            return 1
+
+        print(f"Got Job ID: {job_id}")
+
+        # 2. Test Final Alternatives (all at once per round; the first 200 wins)
+        alternatives = [
+            ("GET", f"{base_url}/job/{job_id}"),
+            ("GET", f"{base_url}/result/{job_id}"),
+            ("GET", f"{base_url}/results/{job_id}"),
+            ("GET", f"{base_url}/search/{job_id}"),
+        ]
+
+        print("\n--- Testing Singular Alternatives ---")
+        # Rounds back off until one answers, instead of a blind 2s sleep before a single try
+        hit = await poll_first_ok(session, alternatives, timeout=10)
+        if hit:
+            method, url, body = hit
+            print(f">>> SUCCESS! <<< {method} {url}")
+            print(body[:200])
 
-except Exception as e:
-    print(f"Request failed: {e}")
+if __name__ == "__main__":
+    try:
+        raise SystemExit(asyncio.run(main()))
+    except Exception as e:
+        print(f"Request failed: {e}")
@@ -1,10 +1,10 @@
-from brain import BrainRouter
+from brain import get_brain
 
 def test_handshake():
     print("Testing Handshake58 (SN58) Consultant...")
     
     try:
-        brain = BrainRouter()
+        brain = get_brain()
         if not hasattr(brain, 'consult_specialist'):
             print("❌ BrainRouter missing 'consult_specialist' method.")
             return
@@ -1,26 +1,36 @@
-from brain import BrainRouter
+import asyncio
+from brain import get_brain
 from rich.console import Console
 
 console = Console()
 
+JOBS = [
+    ("Protein Folding", "PROTEIN_FOLDING", {"sequence": "MKTVR...LLV"}),
+    ("Math Solver", "MATH_SOLVER", {"equation": "42 * x = 1764"}),
+]
+
+async def _run_jobs(brain):
+    # compute_heavy blocks on the dispatch and the wait, so each job runs in a worker
+    # thread; wall time is the slowest job instead of the sum of them
+    return await asyncio.gather(*(
+        asyncio.to_thread(brain.compute_heavy, task_type, payload)
+        for _, task_type, payload in JOBS
+    ))
+
 def test_macrocosm_integration():
     console.print("[bold white]🧪 Testing Macrocosm OS (SN25) Integration...[/bold white]")
     
-    brain = BrainRouter()
-    
-    # Trigger Protein Folding
-    console.print("\n[bold yellow] triggering 'Protein Folding' job...[/bold yellow]")
-    result = brain.compute_heavy("PROTEIN_FOLDING", {"sequence": "MKTVR...LLV"})
-    
-    console.print("-" * 50)
-    console.print(f"[bold green]Result:[/bold green] {result}")
+    brain = get_brain()
+    # Build the lazy client up front so the worker threads share one instance
+    brain.macrocosm_client
 
-    # Trigger Math Solver
-    console.print("\n[bold yellow] triggering 'Math Solver' job...[/bold yellow]")
-    result_math = brain.compute_heavy("MATH_SOLVER", {"equation": "42 * x = 1764"})
-    
-    console.print("-" * 50)
-    console.print(f"[bold green]Result:[/bold green] {result_math}")
+    for label, _, _ in JOBS:
+        console.print(f"\n[bold yellow] triggering '{label}' job...[/bold yellow]")
+    results = asyncio.run(_run_jobs(brain))
+
+    for result in results:
+        console.print("-" * 50)
+        console.print(f"[bold green]Result:[/bold green] {result}")
 
 if __name__ == "__main__":
     test_macrocosm_integration()
@@ -1,24 +1,15 @@
-import requests
+import aiohttp
+import asyncio
 import sys
 
-def check_endpoint(url):
-    print(f"Checking {url}...")
-    try:
-        # Use stream=True to handle SSE
-        with requests.get(url, stream=True, timeout=5) as response:
-            print(f"Status: {response.status_code}")
-            print(f"Headers: {response.headers}")
-            content_type = response.headers.get("Content-Type", "")
-            
-            if "text/event-stream" in content_type:
-                print(">>> SUCCESS: Detected SSE Endpoint! <<<")
-                return True
-            else:
-                print(f"Content-Type: {content_type} (Not SSE)")
-                return False
-    except Exception as e:
-        print(f"Failed: {e}")
-        return False
+# Most probes kept in flight against the host at once
+MAX_IN_FLIGHT = 5
+
+async def check_endpoint(session, url, limit):
+    async with limit:
+        # Only the response headers are read, so an open SSE stream returns at once
+        async with session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as response:
+            return url, response.status, response.headers
 
 endpoints = [
     "https://mcp.taostats.io/sse",
@@ -27,8 +18,32 @@ endpoints = [
     "https://mcp.taostats.io",
 ]
 
-print("--- Probing Taostats MCP Endpoints ---")
-for ep in endpoints:
-    if check_endpoint(ep):
-        break
-    print("-" * 20)
+async def main():
+    print("--- Probing Taostats MCP Endpoints ---")
+    limit = asyncio.Semaphore(MAX_IN_FLIGHT)
+    # Every probe targets the same host: one session keeps the TLS connection alive between them
+    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit_per_host=MAX_IN_FLIGHT)) as session:
+        tasks = [asyncio.create_task(check_endpoint(session, ep, limit)) for ep in endpoints]
+        try:
+            # All endpoints race; the first one serving text/event-stream wins
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    url, status, headers = await next_done
+                except Exception as e:
+                    print(f"Failed: {e}")
+                    continue
+                print(f"{url} -> Status: {status}")
+                content_type = headers.get("Content-Type", "")
+                if "text/event-stream" in content_type:
+                    print(f"Headers: {headers}")
+                    print(f">>> SUCCESS: Detected SSE Endpoint at {url}! <<<")
+                    return 0
+                print(f"Content-Type: {content_type} (Not SSE)")
+                print("-" * 20)
+        finally:
+            for task in tasks:
+                task.cancel()
+    return 1
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -1,8 +1,9 @@
 from stealth_browser import StealthBrowser
 import os
-from dotenv import load_dotenv
+from config import env
 
-load_dotenv()
+# Loads .env into os.environ for the client, once per process
+env()
 
 def test_stealth_browser():
     print("Testing RedTeam (SN61) Stealth Browser...")
@@ -1,5 +1,20 @@
+import re
 from ridges import RidgesGenerator
 
+# Verification Checks
+CHECKS = [
+    "webdriver.Chrome",
+    "--disable-blink-features=AutomationControlled",
+    "navigator.webdriver",
+    "disable-dev-shm-usage",
+    "deviceMemory",
+    "hardwareConcurrency",
+    "window-size=1280,1024"
+]
+# One pass over the script finds every check; the lookahead lets overlapping checks
+# (e.g. "navigator.webdriver.Chrome") all be reported
+_CHECKS_RE = re.compile("(?=(" + "|".join(map(re.escape, CHECKS)) + "))")
+
 def test_ridges_security():
     print("Testing Ridges (SN62) ADA v2 Compliance...")
     
@@ -11,24 +26,13 @@ def test_ridges_security():
     
     print("\n[Generated Script Sample]\n" + script[:200] + "...\n")
     
-    # Verification Checks
-    checks = [
-        "webdriver.Chrome",
-        "--disable-blink-features=AutomationControlled",
-        "navigator.webdriver",
-        "disable-dev-shm-usage",
-        "deviceMemory",
-        "hardwareConcurrency",
-        "window-size=1280,1024"
-    ]
-    
-    passed = True
-    for check in checks:
-        if check in script:
+    found = set(_CHECKS_RE.findall(script))
+    for check in CHECKS:
+        if check in found:
             print(f"✅ Found required flag/code: {check}")
         else:
             print(f"❌ Missing critical security feature: {check}")
-            passed = False
+    passed = len(found) == len(CHECKS)
             
     if passed:
         print("\n✅ ADA v2 Compliance Verified!")
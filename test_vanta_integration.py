@@ -1,14 +1,14 @@
 import os
 import json
 import time
-from brain import BrainRouter
+from brain import get_brain
 
 def test_integration():
     print("Testing Vanta Integration...")
     
     # 1. Verify Imports and Class Structure
     try:
-        brain = BrainRouter()
+        brain = get_brain()
         if not hasattr(brain, 'get_market_sentiment'):
             print("❌ BrainRouter missing 'get_market_sentiment' method.")
             return
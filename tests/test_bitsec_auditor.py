@@ -0,0 +1,61 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import asyncio
+import json
+import unittest
+from unittest.mock import patch, MagicMock
+from bitsec_auditor import BitsecAuditor, SecurityException
+
+def _scan_response(risk, issues=None):
+    mock_response = MagicMock()
+    mock_response.status_code = 200
+    mock_response.content = json.dumps({"risk_level": risk, "issues": issues or []}).encode()
+    return mock_response
+
+class TestBitsecAuditor(unittest.TestCase):
+    def setUp(self):
+        with patch.dict(os.environ, {"BITSEC_API_KEY": "mock_key"}):
+            self.auditor = BitsecAuditor()
+        self.auditor.session.post = MagicMock()
+
+    def test_repeat_audit_served_from_cache(self):
+        self.auditor.session.post.return_value = _scan_response("LOW")
+
+        self.assertTrue(self.auditor.audit("x = 1"))
+        self.assertTrue(self.auditor.audit("x = 1"))
+
+        self.auditor.session.post.assert_called_once()
+
+    def test_rejection_is_cached_and_reraised(self):
+        self.auditor.session.post.return_value = _scan_response("HIGH", ["os.system"])
+
+        for _ in range(2):
+            with self.assertRaises(SecurityException) as ctx:
+                self.auditor.audit("os.system('rm -rf /')")
+            self.assertEqual(ctx.exception.issues, ["os.system"])
+
+        self.auditor.session.post.assert_called_once()
+
+    def test_failed_scan_is_not_cached(self):
+        self.auditor.session.post.return_value = MagicMock(status_code=503)
+
+        self.auditor.audit("y = 2")
+        self.auditor.audit("y = 2")
+
+        self.assertEqual(self.auditor.session.post.call_count, 2)
+
+    def test_audit_many_keeps_order(self):
+        def scan(url, json, timeout):
+            return _scan_response("HIGH" if "system" in json["code"] else "LOW")
+        self.auditor.session.post.side_effect = scan
+
+        results = asyncio.run(self.auditor.audit_many(["a = 1", "os.system('x')", "b = 2"]))
+
+        self.assertIs(results[0], True)
+        self.assertIsInstance(results[1], SecurityException)
+        self.assertIs(results[2], True)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import importlib
+import unittest
+from unittest.mock import patch
+from brain import BrainRouter
+
+class BrainRouterTestCase(unittest.TestCase):
+    @patch('soul_manager.SoulManager')
+    def setUp(self, mock_soul):
+        mock_soul.return_value.load_soul.return_value = "soul"
+        with patch.dict(os.environ, {}, clear=True):
+            self.brain = BrainRouter()
+
+class TestLazyModules(BrainRouterTestCase):
+    @patch('gittensor_client.GittensorClient')
+    def test_module_built_once_on_first_access(self, mock_gittensor):
+        self.assertNotIn("gittensor_client", vars(self.brain))
+
+        first = self.brain.gittensor_client
+        second = self.brain.gittensor_client
+
+        mock_gittensor.assert_called_once_with()
+        self.assertIs(first, second)
+
+    def test_import_brain_does_not_load_subnet_modules(self):
+        subnet_modules = ["gittensor_client", "macrocosm_client", "affine_client",
+                          "taoshi_client", "gopher_client", "context_loader",
+                          "src.tools.manako_vision"]
+        with patch.dict(sys.modules):
+            for name in ["brain", *subnet_modules]:
+                sys.modules.pop(name, None)
+
+            importlib.import_module("brain")
+
+            for name in subnet_modules:
+                self.assertNotIn(name, sys.modules)
+
+    @patch('soul_manager.SoulManager')
+    def test_get_brain_is_shared(self, mock_soul):
+        import brain
+        brain.get_brain.cache_clear()
+        self.addCleanup(brain.get_brain.cache_clear)
+
+        self.assertIs(brain.get_brain(), brain.get_brain())
+        mock_soul.assert_called_once_with()
+
+    def test_unknown_attribute_raises(self):
+        with self.assertRaises(AttributeError):
+            self.brain.not_a_module
+
+class TestEvaluateComplexity(BrainRouterTestCase):
+    def test_tiers(self):
+        self.assertEqual(self.brain._evaluate_complexity("Hi there!"), "low")
+        self.assertEqual(self.brain._evaluate_complexity("Please ANALYZE this"), "high")
+        self.assertEqual(self.brain._evaluate_complexity("x" * 101), "high")
+        self.assertEqual(self.brain._evaluate_complexity("CRITICAL: design the Architecture"), "insane")
+
+class TestGroundingCache(BrainRouterTestCase):
+    @patch('context_loader.ContextLoader')
+    def test_repeat_topic_reuses_grounding(self, mock_loader):
+        mock_loader.return_value.get_deep_context.return_value = "facts"
+
+        self.brain._system_2_deep_thought("deep research on bittensor")
+        self.brain._system_2_deep_thought("deep research on bittensor")
+
+        mock_loader.return_value.get_deep_context.assert_called_once()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+from unittest.mock import patch
+import config
+
+class TestFlags(unittest.TestCase):
+    def setUp(self):
+        config.env.cache_clear()
+        self.addCleanup(config.env.cache_clear)
+
+    def _with_env(self, **values):
+        patcher = patch.dict(os.environ, values)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        config.env.cache_clear()
+
+    @patch('config.load_dotenv')
+    def test_truthy_and_falsy_spellings(self, _):
+        for value in ("1", "true", "YES", " on "):
+            self._with_env(OPENCLAW_SIMULATE=value, OPENCLAW_VERBOSE=value)
+            self.assertTrue(config.simulate(), value)
+            self.assertTrue(config.verbose(), value)
+        for value in ("0", "false", "No", "off"):
+            self._with_env(OPENCLAW_SIMULATE=value, OPENCLAW_VERBOSE=value)
+            self.assertFalse(config.simulate(), value)
+            self.assertFalse(config.verbose(), value)
+
+    @patch('config.load_dotenv')
+    def test_unset_or_unknown_uses_default(self, _):
+        self._with_env(OPENCLAW_SIMULATE="maybe")
+        os.environ.pop("OPENCLAW_VERBOSE", None)
+        config.env.cache_clear()
+        self.assertFalse(config.simulate())
+        self.assertTrue(config.verbose())
+
+if __name__ == '__main__':
+    unittest.main()
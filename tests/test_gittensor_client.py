@@ -0,0 +1,41 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+from gittensor_client import GittensorClient
+
+REPOS = {
+    "org/low": {"tier": "Gold", "weight": 0.2},
+    "org/high": {"tier": "Gold", "weight": 0.9},
+    "org/silver": {"tier": "Silver", "weight": 0.5},
+}
+
+class TestGittensorClient(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.NamedTemporaryFile("w", suffix=".json", delete=False)
+        json.dump(REPOS, tmp)
+        tmp.close()
+        self.addCleanup(os.remove, tmp.name)
+        with patch('gittensor_client.Path', return_value=Path(tmp.name)):
+            self.client = GittensorClient()
+
+    def test_repos_sorted_by_weight(self):
+        names = [r["name"] for r in self.client.get_incentivized_repos()]
+        self.assertEqual(names, ["org/high", "org/silver", "org/low"])
+
+    def test_tier_filter_and_limit(self):
+        gold = self.client.get_incentivized_repos(tier="Gold", limit=1)
+        self.assertEqual(gold, [{"name": "org/high", "tier": "Gold", "weight": 0.9}])
+        self.assertEqual(self.client.get_incentivized_repos(tier="Bronze"), [])
+
+    def test_find_opportunity_picks_from_gold_pool(self):
+        self.assertEqual(self.client._gold_pool, ("org/high", "org/low"))
+        self.assertIn(self.client.find_opportunity()["repo"], self.client._gold_pool)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -24,5 +24,20 @@ class TestHippiusVault(unittest.TestCase):
             headers={"Authorization": "Bearer None"}
         )
 
+class TestHippiusVaultQueue(unittest.IsolatedAsyncioTestCase):
+    async def test_enqueued_saves_are_batched(self):
+        vault = HippiusVault()
+        vault.flush_interval = 0.05
+        with patch.object(vault, 'save_memory', return_value="QmHash") as mock_save:
+            vault.enqueue_save("a.txt", "first")
+            vault.enqueue_save("b.txt", "second")
+            mock_save.assert_not_called()
+            await vault.flush()
+
+        mock_save.assert_called_once()
+        filename, content = mock_save.call_args.args
+        self.assertIn("=== a.txt ===\nfirst", content)
+        self.assertIn("=== b.txt ===\nsecond", content)
+
 if __name__ == '__main__':
     unittest.main()
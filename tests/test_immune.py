@@ -0,0 +1,43 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import unittest
+from unittest.mock import patch
+import immune
+from immune import ImmuneSystem
+
+class TestImmuneScan(unittest.TestCase):
+    @patch('immune.BasilicaSandbox')
+    def setUp(self, mock_sandbox):
+        mock_sandbox.return_value.check_connection.return_value = False
+        self.immune = ImmuneSystem()
+
+    def test_blocks_dangerous_terms(self):
+        self.assertFalse(self.immune.scan_code("import subprocess\nsubprocess.run(['ls'])"))
+        self.assertFalse(self.immune.scan_code("result = eval(user_input)"))
+
+    def test_allows_clean_code(self):
+        self.assertTrue(self.immune.scan_code("def add(a, b):\n    return a + b\n"))
+
+    def test_tiny_code_skips_hash(self):
+        with patch('immune.hashlib.sha256') as sha256:
+            self.assertTrue(self.immune.scan_code("x=1"))
+            sha256.assert_not_called()
+        self.assertFalse(self.immune.scan_code("eval(x)"))
+
+    def test_regex_fallback_matches_automaton(self):
+        with patch.object(immune, "ahocorasick", None):
+            find = immune._build_danger_matcher(immune.DANGEROUS_TERMS)
+        self.assertEqual(find(b"shutil.rmtree('/tmp/x')"), "shutil.rmtree")
+        self.assertIsNone(find(b"print('hello')"))
+
+    def test_scan_bytes_reuses_verdict(self):
+        code = "import os\nos.system('rm -rf /')"
+        self.assertFalse(self.immune.scan_bytes(code.encode()))
+        with patch.object(self.immune, "_find_danger") as find:
+            self.assertFalse(self.immune.scan_code(code))
+            find.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
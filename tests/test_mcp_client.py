@@ -0,0 +1,66 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import json
+import time
+import unittest
+from unittest.mock import AsyncMock, patch
+from mcp_client import MCPClient
+
+class TestMCPToolCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.client = MCPClient("https://mcp.taostats.io/?api_key=test")
+
+    async def test_repeat_call_served_from_cache(self):
+        with patch.object(self.client, "_send_rpc", AsyncMock(return_value={"content": []})) as rpc:
+            first = await self.client.call_tool("GetLatestSubnetPool", {"netuid": 33})
+            second = await self.client.call_tool("GetLatestSubnetPool", {"netuid": 33})
+        self.assertIs(first, second)
+        rpc.assert_awaited_once()
+
+    async def test_bypass_and_failures_not_cached(self):
+        with patch.object(self.client, "_send_rpc", AsyncMock(return_value=None)) as rpc:
+            await self.client.call_tool("GetLatestSubnetPool", {"netuid": 33})
+            await self.client.call_tool("GetLatestSubnetPool", {"netuid": 33})
+        self.assertEqual(rpc.await_count, 2)
+
+        with patch.object(self.client, "_send_rpc", AsyncMock(return_value={"content": []})) as rpc:
+            await self.client.call_tool("GetLatestSubnetPool", {"netuid": 33})
+            await self.client.call_tool("GetLatestSubnetPool", {"netuid": 33}, cache=False)
+        self.assertEqual(rpc.await_count, 2)
+
+    async def test_batch_maps_replies_by_id(self):
+        def frame(rpc_id, value):
+            return json.dumps({"jsonrpc": "2.0", "id": rpc_id, "result": {"value": value}})
+
+        self.client._tool_cache[("Cached", "{}")] = (time.monotonic(), {"value": "hit"})
+        # Replies arrive out of order; ids 100/102 map back to slots 0/2
+        frames = [frame(102, "c"), frame(100, "a")]
+        with patch.object(self.client, "_post_frames", AsyncMock(return_value=frames)) as post:
+            results = await self.client.call_tools_batch([("A", {}), ("Cached", {}), ("C", {})])
+        self.assertEqual(results, [{"value": "a"}, {"value": "hit"}, {"value": "c"}])
+        sent = post.await_args.args[0]
+        self.assertEqual([call["id"] for call in sent], [100, 102])
+
+class TestMalformedFrames(unittest.TestCase):
+    def setUp(self):
+        self.client = MCPClient("https://mcp.taostats.io/?api_key=test")
+
+    def test_bad_items_are_skipped(self):
+        frame = json.dumps({"result": {"content": ["not a dict", {"type": "text", "text": "[1]"}]}})
+        result = self.client._handle_data(frame, print_output=False)
+        self.assertEqual(result["content"][1]["text"], [1])
+
+    def test_tool_without_name_does_not_raise(self):
+        frame = json.dumps({"result": {"tools": [{"description": "no name"}, "junk"]}})
+        with patch("builtins.print"):
+            self.assertIsNotNone(self.client._handle_data(frame))
+
+    def test_malformed_frame_returns_none(self):
+        frame = json.dumps({"result": {"tools": 42}})
+        with patch("builtins.print"):
+            self.assertIsNone(self.client._handle_data(frame))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,90 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import json
+import tempfile
+import unittest
+from unittest.mock import patch, AsyncMock, MagicMock
+from src.finance.paper_trading import RealDataPaperTrading
+
+class TestPaperTrading(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.sim = RealDataPaperTrading()
+        self.sim.log_file = os.path.join(self.tmp.name, "trades.txt")
+
+    async def asyncTearDown(self):
+        await self.sim.close()
+        self.tmp.cleanup()
+
+    async def test_prices_fetched_in_one_call(self):
+        fetch = AsyncMock(return_value={"bitcoin": {"usd": 50000}, "ethereum": {"usd": 2500}})
+        with patch.object(self.sim, '_fetch_usd', fetch):
+            prices = await self.sim._get_real_prices(["BTC", "ETH"])
+
+        self.assertEqual(prices, {"BTC": 50000.0, "ETH": 2500.0})
+        fetch.assert_awaited_once()
+        self.assertEqual(list(fetch.call_args.args[0]), ["bitcoin", "ethereum"])
+
+    async def test_fresh_prices_served_from_cache(self):
+        fetch = AsyncMock(return_value={"bitcoin": {"usd": 50000}})
+        with patch.object(self.sim, '_fetch_usd', fetch):
+            self.assertEqual(await self.sim._get_real_price("BTC"), 50000.0)
+            self.assertEqual(await self.sim._get_real_price("BTC"), 50000.0)
+        fetch.assert_awaited_once()
+
+    async def test_rate_limited_fetch_backs_off_and_retries(self):
+        limited = MagicMock(status=429, headers={"Retry-After": "2"})
+        ok = MagicMock(status=200, headers={})
+        ok.read = AsyncMock(return_value=b'{"bitcoin": {"usd": 50000}}')
+        self.sim.session = MagicMock()
+        self.sim.session.get.return_value.__aenter__.side_effect = [limited, ok]
+
+        with patch.object(self.sim, '_hibernate', AsyncMock(return_value=False)) as hibernate:
+            data = await self.sim._fetch_usd(("bitcoin",))
+
+        self.assertEqual(data, {"bitcoin": {"usd": 50000}})
+        hibernate.assert_awaited_once_with(2.0)
+        self.sim.session = None
+
+    def test_idle_cycles_back_off_until_there_is_work(self):
+        waits = [self.sim._next_interval(True, 60) for _ in range(8)]
+        self.assertEqual(waits[:3], [120, 240, 480])
+        self.assertEqual(waits[-1], 3600.0)
+        self.assertEqual(self.sim._next_interval(False, 60), 60)
+
+    async def test_held_position_keeps_normal_interval(self):
+        self.sim._cash_cents = 0
+        self.sim.portfolio["BTC"]["quantidade"] = 1.0
+        self.sim.portfolio["BTC"]["avg_cost"] = 100.0
+        intervals = []
+        self.sim._next_interval = lambda ocioso, s: intervals.append(ocioso) or s
+
+        async def hibernate(_):
+            return len(intervals) >= 3
+
+        with patch.object(self.sim, '_get_real_prices', AsyncMock(return_value={"BTC": 100.0, "ETH": 10.0})), \
+             patch.object(self.sim, '_hibernate', hibernate):
+            await self.sim.start_vigil_mode(interval_minutes=1)
+
+        self.assertEqual(intervals, [False, False, False])
+
+    async def test_take_profit_sells_position(self):
+        await self.sim.evaluate_and_trade("BTC", 100.0, 100.0)
+        await self.sim.evaluate_and_trade("BTC", 100.0, 100.0 / 3)
+        self.assertAlmostEqual(self.sim.portfolio["BTC"]["quantidade"], 4.0)
+        self.assertAlmostEqual(self.sim.portfolio["BTC"]["avg_cost"], 50.0)
+
+        await self.sim.evaluate_and_trade("BTC", 100.0, 55.0)
+
+        self.assertEqual(self.sim.portfolio["BTC"]["quantidade"], 0.0)
+        self.assertAlmostEqual(self.sim.caixa_virtual, 10020.0)
+
+        await self.sim.close()
+        with open(self.sim.log_file) as f:
+            sides = [json.loads(line)["side"] for line in f]
+        self.assertEqual(sides, ["BUY", "BUY", "SELL"])
+
+if __name__ == '__main__':
+    unittest.main()
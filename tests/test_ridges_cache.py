@@ -0,0 +1,45 @@
+import sys
+import os
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+from ridges import RidgesGenerator
+
+def _stream_of(*deltas):
+    events = []
+    for delta in deltas:
+        event = MagicMock()
+        event.choices[0].delta.content = delta
+        events.append(event)
+    return iter(events)
+
+class TestRidgesCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.generator = RidgesGenerator()
+        self.generator.cache_dir = Path(self.tmp.name)
+        self.generator.verbose = False
+        self.generator.client = MagicMock()
+
+    def test_empty_generation_falls_back_and_is_not_cached(self):
+        self.generator.client.chat.completions.create.return_value = _stream_of("```python\n", "```")
+        script = self.generator.generate_script("https://example.com", "read")
+
+        self.assertIn("webdriver", script)
+        self.assertEqual(list(self.generator.cache_dir.iterdir()), [])
+
+    def test_generated_script_is_cached(self):
+        self.generator.client.chat.completions.create.return_value = _stream_of("print('ok')")
+        first = self.generator.generate_script("https://example.com", "read")
+        second = self.generator.generate_script("https://example.com", "read")
+
+        self.assertEqual(first, "print('ok')")
+        self.assertEqual(second, first)
+        self.generator.client.chat.completions.create.assert_called_once()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,32 +6,46 @@ import unittest
 from unittest.mock import MagicMock, patch
 from brain import BrainRouter
 
+def _stream_of(*deltas):
+    """Builds a fake streamed chat completion yielding the given text deltas."""
+    events = []
+    for delta in deltas:
+        event = MagicMock()
+        event.choices[0].delta.content = delta
+        events.append(event)
+    return iter(events)
+
 class TestSecureRouting(unittest.TestCase):
+    @classmethod
     @patch('brain.Client')
-    @patch('brain.StealthBrowser')
-    @patch('brain.BitsecAuditor')
-    @patch('brain.GopherClient')
-    @patch('brain.HandshakeConsultant')
-    @patch('brain.SoulManager')
-    @patch('brain.ContextLoader')
-    @patch('brain.GittensorClient')
-    @patch('brain.MacrocosmClient')
-    @patch('brain.AffineClient')
-    @patch('brain.TaoshiClient')
-    @patch('brain.ManakoVision')
-    def setUp(self, *args):
+    @patch('stealth_browser.StealthBrowser')
+    @patch('bitsec_auditor.BitsecAuditor')
+    @patch('gopher_client.GopherClient')
+    @patch('handshake_consultant.HandshakeConsultant')
+    @patch('soul_manager.SoulManager')
+    @patch('context_loader.ContextLoader')
+    @patch('gittensor_client.GittensorClient')
+    @patch('macrocosm_client.MacrocosmClient')
+    @patch('affine_client.AffineClient')
+    @patch('taoshi_client.TaoshiClient')
+    @patch('src.tools.manako_vision.ManakoVision')
+    def setUpClass(cls, *args):
+        # One router for the whole class; each test sets its own streamed response
         # Mock environment variables to ensure clients are initialized
         with patch.dict(os.environ, {
             "CHUTES_API_KEY": "mock_key",
             "TARGON_API_KEY": "mock_key"
         }):
-            self.brain = BrainRouter()
+            cls.brain = BrainRouter()
+
+    def setUp(self):
+        # The router is shared, so clear the mock clients' call history between tests
+        self.brain.chutes_client.reset_mock()
+        self.brain.targon_client.reset_mock()
 
     def test_think_secure_routing(self):
         # Mock the Chutes client response
-        mock_response = MagicMock()
-        mock_response.choices[0].message.content = "Secure response"
-        self.brain.chutes_client.chat.completions.create.return_value = mock_response
+        self.brain.chutes_client.chat.completions.create.return_value = _stream_of("Secure ", "response")
 
         # Call think with is_sensitive=True
         result = self.brain.think("my secret password", is_sensitive=True)
@@ -40,13 +54,12 @@ class TestSecureRouting(unittest.TestCase):
         self.brain.chutes_client.chat.completions.create.assert_called()
         call_args = self.brain.chutes_client.chat.completions.create.call_args
         self.assertEqual(call_args.kwargs['model'], "chutes/kimi-k2.5-tee")
+        self.assertTrue(call_args.kwargs['stream'])
         self.assertEqual(result, "Secure response")
 
     def test_think_normal_routing(self):
          # Mock the Chutes client response
-        mock_response = MagicMock()
-        mock_response.choices[0].message.content = "Normal response"
-        self.brain.chutes_client.chat.completions.create.return_value = mock_response
+        self.brain.chutes_client.chat.completions.create.return_value = _stream_of("Normal", None, " response")
         
         # Test normal low complexity prompt
         result = self.brain.think("hello world", is_sensitive=False)